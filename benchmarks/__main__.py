@@ -0,0 +1,92 @@
+"""
+Measure the overhead of LifecycleModelMixin against plain Django models, on an
+in-memory SQLite database:
+
+    python -m benchmarks
+    python -m benchmarks --rows 200 --filter h50 --operation save
+    python -m benchmarks --json results.json
+    python -m benchmarks --rows 100000 --repeat 1 --operation load
+"""
+
+import argparse
+import json
+
+import django
+from django.conf import settings
+
+settings.configure(
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    INSTALLED_APPS=["benchmarks"],
+    DEFAULT_AUTO_FIELD="django.db.models.AutoField",
+    USE_TZ=True,
+)
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from .models import Parent  # noqa: E402
+from .models import Scenario  # noqa: E402
+from .runner import as_dicts  # noqa: E402
+from .runner import run_scenario  # noqa: E402
+
+SCENARIOS = [
+    Scenario(lifecycle=False, width=4),
+    Scenario(width=4),
+    Scenario(width=4, hooks=10),
+    Scenario(width=4, hooks=10, legacy=False),
+    Scenario(width=4, hooks=50),
+    Scenario(width=4, hooks=50, legacy=False),
+    Scenario(width=4, hooks=10, watch_fk=True),
+    Scenario(width=4, hooks=10, lazy=True),
+    Scenario(lifecycle=False, width=40),
+    Scenario(width=40),
+    Scenario(width=40, hooks=10),
+    Scenario(width=40, hooks=10, lazy=True),
+    Scenario(width=40, hooks=50, legacy=False),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--filter", help="only run scenarios whose name contains this string"
+    )
+    parser.add_argument(
+        "--operation",
+        action="append",
+        help=(
+            "only run this operation "
+            "(__init__, iterate, load, save, has_changed, delete)"
+        ),
+    )
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    with connection.schema_editor() as editor:
+        editor.create_model(Parent)
+
+    results = []
+    print(
+        f"{'scenario':<36} {'operation':<12} {'ops/sec':>12} {'peak KiB':>10} {'kept KiB':>10}"
+    )
+
+    for scenario in SCENARIOS:
+        if args.filter and args.filter not in scenario.name:
+            continue
+
+        for result in run_scenario(scenario, args.rows, args.repeat, args.operation):
+            results.append(result)
+            print(
+                f"{result.scenario:<36} {result.operation:<12} "
+                f"{result.ops_per_sec:>12,.0f} {result.peak_memory_kib:>10,.1f} "
+                f"{result.retained_memory_kib:>10,.1f}"
+            )
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(as_dicts(results), output, indent=2)
+
+
+main()
@@ -0,0 +1,99 @@
+"""
+Models are built on the fly for each scenario, so that the number of fields and
+hooks can be parametrized.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.db import models
+
+from django_lifecycle import AFTER_SAVE
+from django_lifecycle import AFTER_UPDATE
+from django_lifecycle import BEFORE_SAVE
+from django_lifecycle import BEFORE_UPDATE
+from django_lifecycle import LifecycleManager
+from django_lifecycle import LifecycleModel
+from django_lifecycle import hook
+from django_lifecycle.conditions import WhenFieldHasChanged
+
+HOOK_MOMENTS = (BEFORE_SAVE, BEFORE_UPDATE, AFTER_SAVE, AFTER_UPDATE)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    lifecycle: bool = True
+    width: int = 4
+    hooks: int = 0
+    legacy: bool = True
+    watch_fk: bool = False
+    lazy: bool = False
+
+    @property
+    def name(self) -> str:
+        if not self.lifecycle:
+            return f"django-w{self.width}"
+
+        name = f"lifecycle-w{self.width}-h{self.hooks}"
+        if self.hooks:
+            name += "-legacy" if self.legacy else "-conditions"
+        if self.watch_fk:
+            name += "-fk"
+        if self.lazy:
+            name += "-lazy"
+        return name
+
+    @property
+    def model_name(self) -> str:
+        return "".join(part.capitalize() for part in self.name.split("-"))
+
+
+class Parent(models.Model):
+    name = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "benchmarks"
+
+
+def _noop(self):
+    pass
+
+
+def _hook_decorator(scenario: Scenario, moment: str, field_name: str):
+    if scenario.legacy:
+        return hook(moment, when=field_name, has_changed=True)
+
+    return hook(moment, condition=WhenFieldHasChanged(field_name, has_changed=True))
+
+
+def build_model(scenario: Scenario) -> type[models.Model]:
+    attrs = {
+        "__module__": __name__,
+        "Meta": type("Meta", (), {"app_label": "benchmarks"}),
+    }
+
+    for i in range(scenario.width):
+        attrs[f"f{i}"] = models.CharField(max_length=50, default="")
+
+    if scenario.watch_fk:
+        attrs["parent"] = models.ForeignKey(Parent, null=True, on_delete=models.CASCADE)
+
+    if scenario.lifecycle:
+        attrs["lifecycle_lazy_snapshot"] = scenario.lazy
+
+        for i in range(scenario.hooks):
+            decorator = _hook_decorator(
+                scenario, HOOK_MOMENTS[i % len(HOOK_MOMENTS)], f"f{i % scenario.width}"
+            )
+            attrs[f"hook_{i}"] = decorator(_noop)
+
+        if scenario.watch_fk:
+            attrs["hook_parent"] = hook(
+                AFTER_UPDATE, when="parent.name", has_changed=True
+            )(_noop)
+            # Parents are only prefetched in batches by a LifecycleManager
+            attrs["objects"] = LifecycleManager()
+
+    base = LifecycleModel if scenario.lifecycle else models.Model
+    return type(scenario.model_name, (base,), attrs)
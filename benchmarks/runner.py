@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Callable
+
+from django.db import connection
+from django.db import models
+
+from .models import Parent
+from .models import Scenario
+from .models import build_model
+
+
+@dataclass
+class Result:
+    scenario: str
+    operation: str
+    ops_per_sec: float
+    peak_memory_kib: float
+    retained_memory_kib: float
+
+
+def _values(model: type[models.Model], parent: Parent | None) -> dict:
+    values = {
+        field.name: f"value {field.name}"
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.CharField)
+    }
+    if parent is not None:
+        values["parent"] = parent
+    return values
+
+
+def _populate(model, rows: int, parent: Parent | None) -> None:
+    model.objects.all().delete()
+    values = _values(model, parent)
+    # Plain Django bulk_create on purpose: the setup must not depend on hooks
+    models.QuerySet(model).bulk_create(model(**values) for _ in range(rows))
+
+
+def _operations(model, rows: int, parent: Parent | None, lifecycle: bool):
+    """
+    Each operation is a (setup, run) pair: `setup` prepares its input outside
+    of the measurement, `run` is measured and returns the number of ops.
+    """
+    values = _values(model, parent)
+    loaded = []
+
+    def setup_rows():
+        _populate(model, rows, parent)
+        return list(model.objects.all())
+
+    def init(_):
+        for _ in range(rows):
+            model(**values)
+        return rows
+
+    def iterate(_):
+        return len(list(model.objects.all()))
+
+    def load(_):
+        # Instances are kept until the next setup, to measure what they retain
+        loaded[:] = model.objects.all()
+        return len(loaded)
+
+    def setup_load():
+        loaded.clear()
+        _populate(model, rows, parent)
+
+    def save(instances):
+        for instance in instances:
+            instance.f0 = "changed"
+            instance.save()
+        return len(instances)
+
+    def has_changed(instances):
+        for instance in instances:
+            instance.f0 = "changed"
+            instance.has_changed("f0")
+        return len(instances)
+
+    def delete(instances):
+        for instance in instances:
+            instance.delete()
+        return len(instances)
+
+    operations = {
+        "__init__": (lambda: None, init),
+        "iterate": (lambda: _populate(model, rows, parent), iterate),
+        "load": (setup_load, load),
+        "save": (setup_rows, save),
+        "delete": (setup_rows, delete),
+    }
+    if lifecycle:
+        operations["has_changed"] = (setup_rows, has_changed)
+
+    return operations
+
+
+def _measure(setup: Callable, run: Callable, repeat: int) -> tuple[float, float, float]:
+    best = 0.0
+
+    for _ in range(repeat):
+        data = setup()
+        gc.collect()
+        start = time.perf_counter()
+        ops = run(data)
+        elapsed = time.perf_counter() - start
+        best = max(best, ops / elapsed)
+
+    # Memory is measured on a separate run, tracing slows everything down
+    data = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(data)
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, peak / 1024, current / 1024
+
+
+def run_scenario(
+    scenario: Scenario, rows: int, repeat: int, operations: list[str] | None = None
+) -> list[Result]:
+    model = build_model(scenario)
+
+    with connection.schema_editor() as editor:
+        editor.create_model(model)
+
+    parent = Parent.objects.create(name="parent") if scenario.watch_fk else None
+    results = []
+
+    try:
+        for name, (setup, run) in _operations(
+            model, rows, parent, scenario.lifecycle
+        ).items():
+            if operations and name not in operations:
+                continue
+
+            results.append(Result(scenario.name, name, *_measure(setup, run, repeat)))
+    finally:
+        with connection.schema_editor() as editor:
+            editor.delete_model(model)
+
+    return results
+
+
+def as_dicts(results: list[Result]) -> list[dict]:
+    return [asdict(result) for result in results]
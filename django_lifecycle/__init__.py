@@ -12,14 +12,19 @@ from .hooks import BEFORE_CREATE
 from .hooks import BEFORE_DELETE
 from .hooks import BEFORE_SAVE
 from .hooks import BEFORE_UPDATE
+from .managers import LifecycleManager
+from .managers import LifecycleQuerySet
 from .mixins import LifecycleModelMixin
 from .mixins import bypass_hooks_for
+from .mixins import warm_up
 from .models import LifecycleModel
 
 __all__ = [
     "hook",
     "LifecycleModelMixin",
     "LifecycleModel",
+    "LifecycleManager",
+    "LifecycleQuerySet",
     "BEFORE_SAVE",
     "AFTER_SAVE",
     "BEFORE_CREATE",
@@ -30,4 +35,5 @@ __all__ = [
     "AFTER_DELETE",
     "NotSet",
     "bypass_hooks_for",
+    "warm_up",
 ]
@@ -1,20 +1,85 @@
+from __future__ import annotations
+
+import copy
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import partial
+from inspect import iscoroutinefunction
 from typing import Any
+from typing import Callable
+
+from asgiref.sync import async_to_sync
+from asgiref.sync import sync_to_async
+
+from .background import submit_hook
+
+
+def frozen_copy(value: Any) -> Any:
+    """Shallow copy of a model instance, or of a list of them"""
+    if isinstance(value, list):
+        return [copy.copy(instance) for instance in value]
+    if isinstance(value, type):
+        return value
+
+    return copy.copy(value)
 
 
 @dataclass(order=False)
 class AbstractHookedMethod(ABC):
     method: Any
     priority: int
+    # Only for on_commit hooked methods: run them with the hook executor
+    background: bool = False
+    # Moment the method is hooked to, e.g. "after_save"
+    hook: str = ""
+
+    def __post_init__(self):
+        self.is_async = iscoroutinefunction(self.method)
 
     @property
     @abstractmethod
     def name(self) -> str: ...
 
+    @property
+    def sync_method(self) -> Any:
+        # Coroutine hooked methods called from `save()` are run to completion
+        return async_to_sync(self.method) if self.is_async else self.method
+
+    def commit_callable(self, func: Callable) -> Callable:
+        """`func`, to call once committed, submitted to the hook executor if needed"""
+        if self.background:
+            return partial(self.submit_frozen, func)
+
+        return func
+
+    def submit_frozen(self, func: Callable, *args: Any) -> None:
+        # Background hooks may run once the initial state of the instances is
+        # reset: they get copies keeping the state as it was committed
+        submit_hook(func, self.name, *[frozen_copy(arg) for arg in args])
+
+    def dedupe_key(self, model: Any) -> tuple[str, str, str]:
+        """
+        Identity of the hooked method for `model`, which doesn't depend on
+        this object: dispatch tables may be rebuilt during a transaction.
+        """
+        method = self.method
+        return (
+            model._meta.label,
+            f"{method.__module__}.{method.__qualname__}",
+            self.hook,
+        )
+
     @abstractmethod
     def run(self, instance: Any) -> None: ...
 
+    async def arun(self, instance: Any) -> None:
+        """Run from async code, in the thread running database queries"""
+        await sync_to_async(self.run)(instance)
+
+    def run_batch(self, model: Any, instances: list[Any]) -> None:
+        for instance in instances:
+            self.run(instance)
+
     def __lt__(self, other):
         if not isinstance(other, AbstractHookedMethod):
             return NotImplemented
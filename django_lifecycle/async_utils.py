@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable
+
+
+async def gather_all(*awaitables: Awaitable) -> None:
+    """
+    Await all `awaitables` concurrently, then raise the first exception if
+    any: none is left running when the caller's transaction is rolled back.
+    """
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
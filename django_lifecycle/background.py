@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+import threading
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+from typing import Callable
+
+from django.db import close_old_connections
+
+logger = logging.getLogger("django_lifecycle")
+
+ErrorHandler = Callable[[str, BaseException], None]
+
+
+def run_hook(func: Callable[[], Any], name: str, on_error: ErrorHandler | None) -> None:
+    """Run a background hook, reporting its exception instead of raising it"""
+    try:
+        func()
+    except Exception as error:
+        if on_error is None:
+            logger.exception("Background hook %s failed", name)
+        else:
+            on_error(name, error)
+
+
+class HookExecutor(ABC):
+    """
+    Runs the `on_commit` hooked methods declared with `background=True`, once
+    the transaction is committed. Subclass it to run them elsewhere, e.g. in a
+    task queue: `func` takes no arguments, and binds the instances it runs
+    for.
+    """
+
+    def __init__(self, on_error: ErrorHandler | None = None):
+        # Called with the hooked method name and the exception it raised,
+        # instead of logging it to the "django_lifecycle" logger
+        self.on_error = on_error
+
+    @abstractmethod
+    def submit(self, func: Callable[[], Any], name: str) -> None: ...
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait for the submitted hooks to be done, return whether they are"""
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+class SynchronousHookExecutor(HookExecutor):
+    """Runs hooks right away in the committing thread, e.g. in tests"""
+
+    def submit(self, func: Callable[[], Any], name: str) -> None:
+        run_hook(func, name, self.on_error)
+
+
+class ThreadPoolHookExecutor(HookExecutor):
+    """
+    Runs hooks in a pool of `max_workers` threads. Submitting waits while
+    `max_pending` hooks are queued or running, so that a burst of commits
+    can't queue work without bounds.
+
+    Threads are started on the first submission. Hooks submitted before the
+    interpreter exits are still run: `concurrent.futures` joins its threads.
+    Once shut down, hooks run right away in the committing thread.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 1000,
+        on_error: ErrorHandler | None = None,
+    ):
+        super().__init__(on_error=on_error)
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._shut_down = False
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._worker = threading.local()
+
+    def submit(self, func: Callable[[], Any], name: str) -> None:
+        # A hook committing more work would wait for a slot forever if every
+        # worker did the same
+        if self._shut_down or getattr(self._worker, "active", False):
+            run_hook(func, name, self.on_error)
+            return
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending < self.max_pending)
+
+            if not self._shut_down:
+                self._pending += 1
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="django_lifecycle",
+                    )
+            executor = self._executor
+
+        if executor is None:
+            # Shut down while waiting for a slot
+            run_hook(func, name, self.on_error)
+            return
+
+        try:
+            executor.submit(self._run, func, name)
+        except RuntimeError:
+            # Shut down, or the interpreter is exiting
+            self._done()
+            run_hook(func, name, self.on_error)
+
+    def _run(self, func: Callable[[], Any], name: str) -> None:
+        self._worker.active = True
+        close_old_connections()
+        try:
+            run_hook(func, name, self.on_error)
+        finally:
+            close_old_connections()
+            self._worker.active = False
+            self._done()
+
+    def _done(self) -> None:
+        with self._condition:
+            self._pending -= 1
+            self._condition.notify_all()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._condition:
+            self._shut_down = True
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_hook_executor: HookExecutor | None = None
+_hook_executor_lock = threading.Lock()
+
+
+def get_hook_executor() -> HookExecutor:
+    global _hook_executor
+
+    with _hook_executor_lock:
+        if _hook_executor is None:
+            _hook_executor = ThreadPoolHookExecutor()
+        return _hook_executor
+
+
+def set_hook_executor(executor: HookExecutor | None) -> HookExecutor | None:
+    """
+    Use `executor` for background hooks, or the default thread pool if None.
+    Return the executor used until now, which isn't shut down.
+    """
+    global _hook_executor
+
+    with _hook_executor_lock:
+        previous, _hook_executor = _hook_executor, executor
+        return previous
+
+
+def submit_hook(func: Callable, name: str, *args: Any) -> None:
+    get_hook_executor().submit(partial(func, *args), name)
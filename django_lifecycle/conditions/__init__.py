@@ -4,7 +4,9 @@ from dataclasses import dataclass
 from typing import Any
 from typing import Iterable
 
-from ..conditions.base import ChainableCondition
+from ..conditions.base import ChainableCondition  # noqa: F401
+from ..conditions.base import Expensive
+from ..conditions.base import FieldCondition
 from ..constants import NotSet
 
 __all__ = [
@@ -15,11 +17,12 @@ __all__ = [
     "WhenFieldValueWasNot",
     "WhenFieldValueChangesTo",
     "Always",
+    "Expensive",
 ]
 
 
 @dataclass
-class WhenFieldValueWas(ChainableCondition):
+class WhenFieldValueWas(FieldCondition):
     field_name: str
     value: Any = "*"
 
@@ -32,7 +35,7 @@ class WhenFieldValueWas(ChainableCondition):
 
 
 @dataclass
-class WhenFieldValueIs(ChainableCondition):
+class WhenFieldValueIs(FieldCondition):
     field_name: str
     value: Any = "*"
 
@@ -45,7 +48,7 @@ class WhenFieldValueIs(ChainableCondition):
 
 
 @dataclass
-class WhenFieldHasChanged(ChainableCondition):
+class WhenFieldHasChanged(FieldCondition):
     field_name: str
     has_changed: bool | None = None
 
@@ -67,7 +70,7 @@ class WhenFieldHasChanged(ChainableCondition):
 
 
 @dataclass
-class WhenFieldValueIsNot(ChainableCondition):
+class WhenFieldValueIsNot(FieldCondition):
     field_name: str
     value: Any = NotSet
 
@@ -81,7 +84,7 @@ class WhenFieldValueIsNot(ChainableCondition):
 
 
 @dataclass
-class WhenFieldValueWasNot(ChainableCondition):
+class WhenFieldValueWasNot(FieldCondition):
     field_name: str
     value: Any = NotSet
 
@@ -95,7 +98,7 @@ class WhenFieldValueWasNot(ChainableCondition):
 
 
 @dataclass
-class WhenFieldValueChangesTo(ChainableCondition):
+class WhenFieldValueChangesTo(FieldCondition):
     field_name: str
     value: Any = NotSet
 
@@ -119,3 +122,6 @@ class WhenFieldValueChangesTo(ChainableCondition):
 class Always:
     def __call__(self, instance: Any, update_fields=None):
         return True
+
+    def watched_field_names(self) -> set[str]:
+        return set()
@@ -11,15 +11,35 @@ from .. import types
 
 @dataclass
 class ChainedCondition:
+    """
+    Conditions joined with `&` or `|`. Chains of the same operator are
+    flattened into a single list, evaluated cheapest first and stopping as
+    soon as the result is known.
+    """
+
     def __init__(
         self,
         left: types.Condition,
         right: types.Condition,
         operator: Callable[[Any, Any], bool],
     ):
-        self.left = left
-        self.right = right
         self.operator = operator
+        conditions = [*self._flatten(left), *self._flatten(right)]
+        # Stable sort: conditions of the same cost keep their declaration order
+        self.conditions = sorted(conditions, key=condition_is_expensive)
+
+    def _flatten(self, condition: types.Condition) -> list[types.Condition]:
+        if (
+            isinstance(condition, ChainedCondition)
+            and condition.operator is self.operator
+        ):
+            return condition.conditions
+
+        return [condition]
+
+    @property
+    def is_expensive(self) -> bool:
+        return any(condition_is_expensive(condition) for condition in self.conditions)
 
     def __and__(self, other):
         return ChainedCondition(self, other, operator=operator.and_)
@@ -30,14 +50,36 @@ class ChainedCondition:
     def __call__(
         self, instance: Any, update_fields: Iterable[str] | None = None
     ) -> bool:
-        left_result = self.left(instance, update_fields)
-        right_result = self.right(instance, update_fields)
-        return self.operator(left_result, right_result)
+        if self.operator is operator.and_:
+            for condition in self.conditions:
+                if not condition(instance, update_fields):
+                    return False
+            return True
+
+        for condition in self.conditions:
+            if condition(instance, update_fields):
+                return True
+        return False
+
+    def watched_field_names(self) -> set[str] | None:
+        watched = set()
+
+        for condition in self.conditions:
+            field_names = get_watched_field_names(condition)
+            if field_names is None:
+                return None
+            watched |= field_names
+
+        return watched
 
 
 class ChainableCondition:
     """Base class for defining chainable conditions using `&` and `|`"""
 
+    # Expensive conditions (e.g. ones hitting the database) are evaluated
+    # after the cheap ones in a chain
+    is_expensive = False
+
     def __and__(self, other) -> ChainedCondition:
         return ChainedCondition(self, other, operator=operator.and_)
 
@@ -47,3 +89,52 @@ class ChainableCondition:
     def __call__(
         self, instance: Any, update_fields: Iterable[str] | None = None
     ) -> bool: ...
+
+    def watched_field_names(self) -> set[str] | None:
+        """
+        Field names this condition reads, or None if they can't be known
+        (e.g. a custom condition reading arbitrary attributes).
+        """
+        return None
+
+
+class FieldCondition(ChainableCondition):
+    """Base class for conditions on the value of a single field"""
+
+    field_name: str
+
+    @property
+    def is_expensive(self) -> bool:
+        # Dotted paths may query related models
+        return "." in self.field_name
+
+    def watched_field_names(self) -> set[str]:
+        return {self.field_name}
+
+
+@dataclass
+class Expensive(ChainableCondition):
+    """Marks a condition as costly so chains evaluate it last"""
+
+    condition: types.Condition
+    is_expensive = True
+
+    def __call__(
+        self, instance: Any, update_fields: Iterable[str] | None = None
+    ) -> bool:
+        return self.condition(instance, update_fields)
+
+    def watched_field_names(self) -> set[str] | None:
+        return get_watched_field_names(self.condition)
+
+
+def condition_is_expensive(condition: types.Condition) -> bool:
+    return getattr(condition, "is_expensive", False) is True
+
+
+def get_watched_field_names(condition: types.Condition) -> set[str] | None:
+    watched_field_names = getattr(condition, "watched_field_names", None)
+    if watched_field_names is None:
+        return None
+
+    return watched_field_names()
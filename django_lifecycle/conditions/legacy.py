@@ -3,18 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from ..conditions import WhenFieldHasChanged
-from ..conditions import WhenFieldValueChangesTo
-from ..conditions import WhenFieldValueIs
-from ..conditions import WhenFieldValueIsNot
-from ..conditions import WhenFieldValueWas
-from ..conditions import WhenFieldValueWasNot
 from ..conditions.base import ChainableCondition
 from ..constants import NotSet
 
 
 @dataclass
 class When(ChainableCondition):
+    """
+    Evaluates all the legacy parameters for one field in a single pass. Checks
+    whose parameter is left to its wildcard/`NotSet` default are dropped when
+    the condition is built, and initial/current values are read at most once.
+    """
+
     when: str | None = None
     was: Any = "*"
     is_now: Any = "*"
@@ -23,36 +23,59 @@ class When(ChainableCondition):
     was_not: Any = NotSet
     changes_to: Any = NotSet
 
-    def __call__(self, instance: Any, update_fields=None) -> bool:
-        has_changed_condition = WhenFieldHasChanged(
-            self.when,
-            has_changed=self.has_changed,
+    def __post_init__(self):
+        self._check_changes_to = self.changes_to is not NotSet
+        self._check_is_now = self.is_now != "*"
+        self._check_was = self.was != "*"
+        self._check_was_not = self.was_not is not NotSet
+        self._check_is_not = self.is_not is not NotSet
+        self._needs_current_value = (
+            self._check_changes_to or self._check_is_now or self._check_is_not
+        )
+        self._needs_initial_value = (
+            self._check_changes_to or self._check_was or self._check_was_not
         )
-        if not has_changed_condition(instance, update_fields=update_fields):
+
+    def __call__(self, instance: Any, update_fields=None) -> bool:
+        if update_fields is not None and self.when not in update_fields:
             return False
 
-        changes_to_condition = WhenFieldValueChangesTo(self.when, value=self.changes_to)
-        if not changes_to_condition(instance, self.when):
+        if self.has_changed is not None and self.has_changed != instance.has_changed(
+            self.when
+        ):
             return False
 
-        is_now_condition = WhenFieldValueIs(self.when, value=self.is_now)
-        if not is_now_condition(instance, self.when):
+        if self._needs_current_value:
+            current_value = instance._current_value(self.when)
+        if self._needs_initial_value:
+            initial_value = instance.initial_value(self.when)
+
+        if self._check_changes_to and not (
+            initial_value != self.changes_to and current_value == self.changes_to
+        ):
+            return False
+
+        if self._check_is_now and self.is_now not in (current_value, "*"):
             return False
 
-        was_condition = WhenFieldValueWas(self.when, value=self.was)
-        if not was_condition(instance, self.when):
+        if self._check_was and self.was not in (initial_value, "*"):
             return False
 
-        was_not_condition = WhenFieldValueWasNot(self.when, value=self.was_not)
-        if not was_not_condition(instance, self.when):
+        if self._check_was_not and initial_value == self.was_not:
             return False
 
-        is_not_condition = WhenFieldValueIsNot(self.when, value=self.is_not)
-        if not is_not_condition(instance, self.when):
+        if self._check_is_not and current_value == self.is_not:
             return False
 
         return True
 
+    @property
+    def is_expensive(self) -> bool:
+        return "." in self.when
+
+    def watched_field_names(self) -> set[str]:
+        return {self.when}
+
 
 @dataclass
 class WhenAny:
@@ -64,8 +87,8 @@ class WhenAny:
     was_not: Any = NotSet
     changes_to: Any = NotSet
 
-    def __call__(self, instance: Any, update_fields=None) -> bool:
-        conditions = (
+    def __post_init__(self):
+        self._conditions = [
             When(
                 when=field,
                 was=self.was,
@@ -76,7 +99,14 @@ class WhenAny:
                 changes_to=self.changes_to,
             )
             for field in self.when_any
-        )
-        return any(
-            condition(instance, update_fields=update_fields) for condition in conditions
-        )
+        ]
+
+    def __call__(self, instance: Any, update_fields=None) -> bool:
+        for condition in self._conditions:
+            if condition(instance, update_fields=update_fields):
+                return True
+
+        return False
+
+    def watched_field_names(self) -> set[str]:
+        return set(self.when_any)
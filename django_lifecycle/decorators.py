@@ -1,29 +1,45 @@
 from __future__ import annotations
 
-import operator
+import weakref
 from dataclasses import dataclass
-from functools import reduce
 from functools import wraps
+from inspect import iscoroutinefunction
 from typing import Any
 from typing import Callable
 
 from . import types
 from .conditions import Always
 from .conditions.legacy import When
+from .conditions.legacy import WhenAny
 from .constants import NotSet
 from .dataclass_validation import Validations
+from .hooks import AFTER_SAVE
+from .hooks import AFTER_UPDATE
 from .hooks import VALID_HOOKS
 from .priority import DEFAULT_PRIORITY
 
 
+# Every function decorated with `hook`, so that the classes defining them can
+# be told by their `__module__` and `__qualname__` without inspecting models
+hooked_functions: weakref.WeakSet = weakref.WeakSet()
+
+
 class DjangoLifeCycleException(Exception):
     pass
 
 
+class UnloadedFieldError(DjangoLifeCycleException):
+    """A hook condition reads a deferred field that mustn't be loaded"""
+
+
 @dataclass(order=False)
 class HookConfig(Validations):
     hook: str
     on_commit: bool = False
+    batch: bool = False
+    dedupe: bool = False
+    background: bool = False
+    on_unchanged: bool = False
     priority: int = DEFAULT_PRIORITY
     condition: types.Condition | None = None
 
@@ -70,20 +86,14 @@ class HookConfig(Validations):
             )
 
         elif self.when_any:
-            return reduce(
-                operator.or_,
-                [
-                    When(
-                        when=field,
-                        was=self.was,
-                        is_now=self.is_now,
-                        has_changed=self.has_changed,
-                        is_not=self.is_not,
-                        was_not=self.was_not,
-                        changes_to=self.changes_to,
-                    )
-                    for field in self.when_any
-                ],
+            return WhenAny(
+                when_any=self.when_any,
+                was=self.was,
+                is_now=self.is_now,
+                has_changed=self.has_changed,
+                is_not=self.is_not,
+                was_not=self.was_not,
+                changes_to=self.changes_to,
             )
         else:
             return Always()
@@ -142,6 +152,32 @@ class HookConfig(Validations):
 
         return value
 
+    def validate_batch(self, value, **kwargs):
+        if not isinstance(value, bool):
+            raise DjangoLifeCycleException("'batch' hook param must be a boolean")
+
+        return value
+
+    def validate_dedupe(self, value, **kwargs):
+        if not isinstance(value, bool):
+            raise DjangoLifeCycleException("'dedupe' hook param must be a boolean")
+
+        return value
+
+    def validate_background(self, value, **kwargs):
+        if not isinstance(value, bool):
+            raise DjangoLifeCycleException("'background' hook param must be a boolean")
+
+        return value
+
+    def validate_on_unchanged(self, value, **kwargs):
+        if not isinstance(value, bool):
+            raise DjangoLifeCycleException(
+                "'on_unchanged' hook param must be a boolean"
+            )
+
+        return value
+
     def validate_priority(self, value, **kwargs):
         if self.priority < 0:
             raise DjangoLifeCycleException(
@@ -156,6 +192,24 @@ class HookConfig(Validations):
                 "'on_commit' hook param is only valid with AFTER_* hooks"
             )
 
+    def validate_dedupe_only_with_on_commit(self):
+        if self.dedupe and not self.on_commit:
+            raise DjangoLifeCycleException(
+                "'dedupe' hook param is only valid with 'on_commit'"
+            )
+
+    def validate_background_only_with_on_commit(self):
+        if self.background and not self.on_commit:
+            raise DjangoLifeCycleException(
+                "'background' hook param is only valid with 'on_commit'"
+            )
+
+    def validate_on_unchanged_only_for_after_save_hooks(self):
+        if self.on_unchanged and self.hook not in (AFTER_SAVE, AFTER_UPDATE):
+            raise DjangoLifeCycleException(
+                "'on_unchanged' hook param is only valid with AFTER_SAVE and AFTER_UPDATE"
+            )
+
     def validate_when_and_when_any(self):
         if self.when is not None and self.when_any is not None:
             raise DjangoLifeCycleException(
@@ -171,6 +225,9 @@ class HookConfig(Validations):
     def validate(self):
         self.validate_when_and_when_any()
         self.validate_on_commit_only_for_after_hooks()
+        self.validate_dedupe_only_with_on_commit()
+        self.validate_background_only_with_on_commit()
+        self.validate_on_unchanged_only_for_after_save_hooks()
         self.validate_condition_and_legacy_parameters_are_not_combined()
 
     def __lt__(self, other):
@@ -181,12 +238,20 @@ class HookConfig(Validations):
 
     def __call__(self, hooked_method):
         if not hasattr(hooked_method, "_hooked"):
+            if iscoroutinefunction(hooked_method):
+
+                @wraps(hooked_method)
+                async def func(*args, **kwargs):
+                    await hooked_method(*args, **kwargs)
+
+            else:
 
-            @wraps(hooked_method)
-            def func(*args, **kwargs):
-                hooked_method(*args, **kwargs)
+                @wraps(hooked_method)
+                def func(*args, **kwargs):
+                    hooked_method(*args, **kwargs)
 
             func._hooked = []
+            hooked_functions.add(func)
         else:
             func = hooked_method
 
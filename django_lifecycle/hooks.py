@@ -21,3 +21,17 @@ VALID_HOOKS = (
     BEFORE_DELETE,
     AFTER_DELETE,
 )
+
+SAVE_HOOKS = (
+    BEFORE_SAVE,
+    AFTER_SAVE,
+    BEFORE_CREATE,
+    AFTER_CREATE,
+    BEFORE_UPDATE,
+    AFTER_UPDATE,
+)
+
+DELETE_HOOKS = (
+    BEFORE_DELETE,
+    AFTER_DELETE,
+)
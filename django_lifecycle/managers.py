@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Iterable
+
+from django.db import models
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.db.models.query import ModelIterable
+
+from .hooks import AFTER_CREATE
+from .hooks import AFTER_SAVE
+from .hooks import AFTER_UPDATE
+from .hooks import BEFORE_CREATE
+from .hooks import BEFORE_SAVE
+from .hooks import BEFORE_UPDATE
+from .mixins import _bypass_state
+from .model_state import defer_related_fields_snapshot
+from .on_commit import reset_initial_state_on_commit
+
+
+class LifecycleModelIterable(ModelIterable):
+    """
+    Loads the related objects traversed by watched dotted paths (e.g.
+    "organization.name") with one `prefetch_related` query per chunk of
+    instances, instead of one query per instance while snapshotting.
+    """
+
+    def __iter__(self):
+        prefetch_paths = self.queryset.model._watched_fk_prefetch_paths()
+        if not prefetch_paths:
+            yield from super().__iter__()
+            return
+
+        # Rows are all in memory unless streaming: prefetch for all of them
+        chunk_size = self.chunk_size if self.chunked_fetch else None
+        instances = super().__iter__()
+
+        while True:
+            # Only defer the snapshot while this iterator builds instances
+            deferred = []
+            token = defer_related_fields_snapshot.set((self.queryset.model, deferred))
+            try:
+                chunk = list(islice(instances, chunk_size))
+            finally:
+                defer_related_fields_snapshot.reset(token)
+
+            if not chunk:
+                return
+
+            # Instances of the same model loaded by `select_related` are deferred too
+            to_prefetch = list(
+                {id(instance): instance for instance in chunk + deferred}.values()
+            )
+            prefetch_related_objects(to_prefetch, *prefetch_paths)
+            for instance in deferred:
+                instance._initial_state.snapshot_related_fields(instance)
+
+            yield from chunk
+
+
+class LifecycleQuerySet(models.QuerySet):
+    """
+    QuerySet whose bulk operations fire the model's lifecycle hooks, running
+    each hooked method once per batch instead of once per row. Related
+    objects needed by watched dotted paths are prefetched in batch.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._iterable_class = LifecycleModelIterable
+
+    def _hooks_are_skipped(self, skip_hooks: bool) -> bool:
+        return skip_hooks or _bypass_state.is_bypassed_for(self.model)
+
+    def bulk_create(
+        self, objs: Iterable[models.Model], *args, skip_hooks: bool = False, **kwargs
+    ) -> list[models.Model]:
+        """
+        Fire BEFORE_CREATE and BEFORE_SAVE hooks over the whole batch, insert
+        it with a single `bulk_create`, then fire AFTER_SAVE and AFTER_CREATE
+        hooks with the primary keys returned by the database (on backends that
+        support it).
+
+        With `ignore_conflicts` or `update_conflicts`, which rows were inserted
+        can't be told: only the BEFORE_* hooks run, and initial states aren't
+        reset.
+        """
+        objs = list(objs)
+
+        if not objs or self._hooks_are_skipped(skip_hooks):
+            return super().bulk_create(objs, *args, **kwargs)
+
+        conflicts = kwargs.get("ignore_conflicts") or kwargs.get("update_conflicts")
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            self.model._run_hooked_methods_in_batch(objs, BEFORE_CREATE)
+            self.model._run_hooked_methods_in_batch(objs, BEFORE_SAVE)
+            objs = super().bulk_create(objs, *args, **kwargs)
+            if conflicts:
+                return objs
+
+            self.model._run_hooked_methods_in_batch(objs, AFTER_SAVE)
+            self.model._run_hooked_methods_in_batch(objs, AFTER_CREATE)
+
+        reset_initial_state_on_commit(objs, using=self.db)
+        return objs
+
+    def bulk_update(
+        self,
+        objs: Iterable[models.Model],
+        fields: Iterable[str] | None = None,
+        *args,
+        skip_hooks: bool = False,
+        **kwargs,
+    ) -> int:
+        """
+        Fire BEFORE_UPDATE and BEFORE_SAVE hooks over the whole batch, write it
+        with a single `bulk_update`, then fire AFTER_SAVE and AFTER_UPDATE hooks.
+
+        When `fields` isn't given, the instances are diffed against their
+        initial state, or the values last written in the transaction (after
+        the BEFORE_* hooks ran), and the union of their changed fields is
+        written, whether hooks are skipped or not. Otherwise, `fields` is
+        passed to conditions as `update_fields`, like `save(update_fields=...)`
+        does.
+        """
+        objs = list(objs)
+
+        if self._hooks_are_skipped(skip_hooks):
+            if fields is None:
+                fields = self._get_changed_field_names(objs)
+                if not fields:
+                    return 0
+
+            rows = super().bulk_update(objs, fields, *args, **kwargs)
+            self._record_written_values(objs, fields)
+            return rows
+
+        update_fields = None if fields is None else list(fields)
+        rows = 0
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            self.model._run_hooked_methods_in_batch(
+                objs, BEFORE_UPDATE, update_fields=update_fields
+            )
+            self.model._run_hooked_methods_in_batch(
+                objs, BEFORE_SAVE, update_fields=update_fields
+            )
+
+            fields = update_fields
+            if fields is None:
+                fields = self._get_changed_field_names(objs)
+
+            if objs and fields:
+                rows = super().bulk_update(objs, fields, *args, **kwargs)
+                self._record_written_values(objs, fields)
+
+            self.model._run_hooked_methods_in_batch(
+                objs, AFTER_SAVE, update_fields=update_fields
+            )
+            self.model._run_hooked_methods_in_batch(
+                objs, AFTER_UPDATE, update_fields=update_fields
+            )
+
+        reset_initial_state_on_commit(objs, using=self.db)
+        return rows
+
+    def _record_written_values(
+        self, objs: list[models.Model], fields: Iterable[str]
+    ) -> None:
+        kwargs = {"update_fields": list(fields)}
+        for obj in objs:
+            obj._record_written_values((), kwargs)
+
+    def _get_changed_field_names(self, objs: list[models.Model]) -> list[str]:
+        changed = {}
+
+        for obj in objs:
+            field_names = obj._get_changed_field_names()
+            if field_names is None:
+                return list(self.model._concrete_field_names_by_attname().values())
+            changed.update(dict.fromkeys(field_names))
+
+        return list(changed)
+
+
+class LifecycleManager(models.Manager.from_queryset(LifecycleQuerySet)):
+    pass
@@ -1,24 +1,35 @@
 from __future__ import annotations
 
-import threading
+import copy
 from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import lru_cache
 from functools import partial
 from inspect import isfunction
+from itertools import groupby
+from time import perf_counter
 from typing import Any
+from typing import Dict
 from typing import Iterable
+from typing import List
+from typing import Tuple
 from typing import TypeVar
 
+from asgiref.sync import async_to_sync
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
 from django.db import transaction
-from django.db.models.fields.related_descriptors import ForwardManyToOneDescriptor
-from django.db.models.fields.related_descriptors import ForwardOneToOneDescriptor
-from django.db.models.fields.related_descriptors import ManyToManyDescriptor
-from django.db.models.fields.related_descriptors import ReverseManyToOneDescriptor
-from django.db.models.fields.related_descriptors import ReverseOneToOneDescriptor
-from django.utils.functional import cached_property
+from django.db.models import DEFERRED
+from django.db.models.signals import class_prepared
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
 
 from .abstract import AbstractHookedMethod
+from .async_utils import gather_all
+from .conditions.base import get_watched_field_names
 from .decorators import HookConfig
+from .decorators import UnloadedFieldError
 from .hooks import AFTER_CREATE
 from .hooks import AFTER_DELETE
 from .hooks import AFTER_SAVE
@@ -27,39 +38,49 @@ from .hooks import BEFORE_CREATE
 from .hooks import BEFORE_DELETE
 from .hooks import BEFORE_SAVE
 from .hooks import BEFORE_UPDATE
+from .hooks import DELETE_HOOKS
+from .hooks import SAVE_HOOKS
 from .model_state import ModelState
+from .model_state import SnapshotLayout
+from .model_state import defer_snapshot
+from .on_commit import reset_initial_state_on_commit
+from .on_commit import run_once_on_commit
+from .on_commit import with_initial_states
+from .profiling import hook_profiler
+from .profiling import skipped_saves
+from .utils import get_field_name_map
 from .utils import get_value
 from .utils import sanitize_field_name
-
-DJANGO_RELATED_FIELD_DESCRIPTOR_CLASSES = (
-    ForwardManyToOneDescriptor,
-    ForwardOneToOneDescriptor,
-    ManyToManyDescriptor,
-    ReverseManyToOneDescriptor,
-    ReverseOneToOneDescriptor,
-)
+from .utils import split_field_path
 
 
 class LifecycleHookBypass:
-    def __init__(self):
-        self._state = threading.local()
+    """
+    Models whose hooks are bypassed in the current context, keyed by class
+    with a count of the nested bypasses. The dict held by the context
+    variable is replaced rather than mutated, so that threads, asyncio tasks
+    and `sync_to_async()` calls each see the bypasses of their own context.
+    """
 
-    @staticmethod
-    def get_model_full_name(model) -> str:
-        return f"{model.__module__}:{model.__qualname__}"
+    def __init__(self):
+        self._models: ContextVar[dict[type, int]] = ContextVar(
+            "django_lifecycle_bypassed_models", default={}
+        )
 
     def set_bypass_for(self, model):
-        setattr(
-            self._state,
-            self.get_model_full_name(model),
-            True,
-        )
+        models = self._models.get()
+        self._models.set({**models, model: models.get(model, 0) + 1})
 
     def remove_bypass_for(self, model):
-        delattr(self._state, self.get_model_full_name(model))
+        models = dict(self._models.get())
+        count = models.pop(model) - 1
+        if count:
+            models[model] = count
+
+        self._models.set(models)
 
     def is_bypassed_for(self, model) -> bool:
-        return getattr(self._state, self.get_model_full_name(model), False)
+        return model in self._models.get()
 
 
 _bypass_state = LifecycleHookBypass()
@@ -71,7 +92,13 @@ class HookedMethod(AbstractHookedMethod):
         return self.method.__name__
 
     def run(self, instance: Any) -> None:
-        self.method(instance)
+        self.sync_method(instance)
+
+    async def arun(self, instance: Any) -> None:
+        if self.is_async:
+            await self.method(instance)
+        else:
+            await super().arun(instance)
 
 
 class OnCommitHookedMethod(AbstractHookedMethod):
@@ -86,39 +113,500 @@ class OnCommitHookedMethod(AbstractHookedMethod):
     def run(self, instance: Any) -> None:
         # Use partial to create a function closure that binds `self`
         # to ensure it's available to execute later.
-        _on_commit_func = partial(self.method, instance)
+        _on_commit_func = partial(
+            with_initial_states(self.commit_callable(self.sync_method), [instance]),
+            instance,
+        )
+        _on_commit_func.__name__ = self.name
+        transaction.on_commit(_on_commit_func)
+
+
+class BatchHookedMethod(AbstractHookedMethod):
+    """
+    Hooked method receiving the model class and the list of instances its
+    conditions passed for, e.g. all the rows of a `bulk_create`.
+    """
+
+    @property
+    def name(self) -> str:
+        return self.method.__name__
+
+    def run(self, instance: Any) -> None:
+        self.run_batch(instance.__class__, [instance])
+
+    def run_batch(self, model: Any, instances: list[Any]) -> None:
+        self.sync_method(model, instances)
+
+    async def arun(self, instance: Any) -> None:
+        if self.is_async:
+            await self.method(instance.__class__, [instance])
+        else:
+            await super().arun(instance)
+
+
+class OnCommitBatchHookedMethod(BatchHookedMethod):
+    """Batch hooked method that should run on_commit"""
+
+    @property
+    def name(self) -> str:
+        return f"{self.method.__name__}_on_commit"
+
+    def run_batch(self, model: Any, instances: list[Any]) -> None:
+        _on_commit_func = partial(
+            with_initial_states(self.commit_callable(self.sync_method), instances),
+            model,
+            instances,
+        )
         _on_commit_func.__name__ = self.name
         transaction.on_commit(_on_commit_func)
 
+    # Only registers the on_commit callback
+    arun = AbstractHookedMethod.arun
+
+
+class DedupedOnCommitHookedMethod(OnCommitHookedMethod):
+    """
+    Hooked method that should run on_commit, once per row and transaction no
+    matter how many times its conditions passed.
+    """
+
+    def run(self, instance: Any) -> None:
+        self.run_batch(instance.__class__, [instance])
+
+    def run_batch(self, model: Any, instances: list[Any]) -> None:
+        _on_commit_func = self.commit_callable(
+            partial(self._run_each, self.sync_method)
+        )
+        _on_commit_func.__name__ = self.name
+        run_once_on_commit(self.dedupe_key(model), _on_commit_func, model, instances)
+
+    @staticmethod
+    def _run_each(method: Any, model: Any, instances: list[Any]) -> None:
+        for instance in instances:
+            method(instance)
+
+
+class DedupedOnCommitBatchHookedMethod(OnCommitBatchHookedMethod):
+    """
+    Batch hooked method that should run on_commit, called once per
+    transaction with every row its conditions passed for.
+    """
+
+    def run_batch(self, model: Any, instances: list[Any]) -> None:
+        _on_commit_func = partial(self.commit_callable(self.sync_method))
+        _on_commit_func.__name__ = self.name
+        run_once_on_commit(self.dedupe_key(model), _on_commit_func, model, instances)
+
+
+# Per concrete model traversed by a watched dotted path, bumped whenever one
+# of its instances is saved or deleted in this process
+_related_model_versions: dict[type, int] = {}
+
+
+def _bump_related_model_version(sender, **kwargs) -> None:
+    model = sender._meta.concrete_model
+    if model in _related_model_versions:
+        _related_model_versions[model] += 1
+
+
+def track_related_model_versions(models: Iterable[type]) -> None:
+    for model in models:
+        if model in _related_model_versions:
+            continue
+
+        _related_model_versions[model] = 0
+
+        # Only the model and its proxies: saves of other models aren't
+        # dispatched here
+        for sender in model._meta.apps.get_models():
+            if sender._meta.concrete_model is model:
+                post_save.connect(
+                    _bump_related_model_version,
+                    sender=sender,
+                    dispatch_uid="django_lifecycle_related_save",
+                )
+                post_delete.connect(
+                    _bump_related_model_version,
+                    sender=sender,
+                    dispatch_uid="django_lifecycle_related_delete",
+                )
+
 
 def instantiate_hooked_method(
     method: Any, callback_specs: HookConfig
 ) -> AbstractHookedMethod:
-    hooked_method_class = (
-        OnCommitHookedMethod if callback_specs.on_commit else HookedMethod
-    )
+    if callback_specs.batch:
+        if callback_specs.dedupe:
+            hooked_method_class = DedupedOnCommitBatchHookedMethod
+        elif callback_specs.on_commit:
+            hooked_method_class = OnCommitBatchHookedMethod
+        else:
+            hooked_method_class = BatchHookedMethod
+    elif callback_specs.dedupe:
+        hooked_method_class = DedupedOnCommitHookedMethod
+    elif callback_specs.on_commit:
+        hooked_method_class = OnCommitHookedMethod
+    else:
+        hooked_method_class = HookedMethod
+
     return hooked_method_class(
         method=method,
         priority=callback_specs.priority,
+        background=callback_specs.background,
+        hook=callback_specs.hook,
     )
 
 
+HookDispatchTable = Dict[str, List[Tuple[HookConfig, AbstractHookedMethod]]]
+
+
+def build_hook_dispatch_table(methods: Iterable[Any]) -> HookDispatchTable:
+    """
+    Group every (config, hooked method) pair by hook name, instantiating the
+    hooked methods up front and sorting each group by priority. Python's sort
+    is stable, so ties keep the declaration order.
+    """
+    table = {}
+
+    for method in methods:
+        for callback_specs in method._hooked:
+            table.setdefault(callback_specs.hook, []).append(
+                (callback_specs, instantiate_hooked_method(method, callback_specs))
+            )
+
+    for entries in table.values():
+        entries.sort(key=lambda entry: entry[1].priority)
+
+    return table
+
+
+class DirtyFieldDescriptor:
+    """
+    Wraps the descriptor Django installs for a concrete field and reports
+    assignments to the instance's model state before they happen.
+    """
+
+    def __init__(self, attname: str, descriptor: Any):
+        self.attname = attname
+        self.descriptor = descriptor
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self.descriptor.__get__(None, cls)
+
+        try:
+            return instance.__dict__[self.attname]
+        except KeyError:
+            # Deferred field: let Django load it
+            return self.descriptor.__get__(instance, cls)
+
+    def __set__(self, instance, value):
+        instance_dict = instance.__dict__
+        state = instance_dict.get("_initial_state")
+
+        if state is not None:
+            state.record_assignment(
+                self.attname, instance_dict.get(self.attname, DEFERRED)
+            )
+
+        if hasattr(self.descriptor, "__set__"):
+            self.descriptor.__set__(instance, value)
+        else:
+            instance_dict[self.attname] = value
+
+
+class LazyInitialStateDescriptor:
+    """
+    Builds the initial state of instances of lazily snapshotted models from
+    the values they were loaded with, the first time it's accessed. Only
+    looked up when `_initial_state` isn't in the instance __dict__ yet.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        lazy_snapshot = instance.__dict__.pop("_lazy_snapshot", None)
+        if lazy_snapshot is None:
+            raise AttributeError(
+                f"'{cls.__name__}' object has no attribute '_initial_state'"
+            )
+
+        state = instance.lifecycle_state_class.from_db_values(instance, *lazy_snapshot)
+        instance.__dict__["_initial_state"] = state
+        return state
+
+
+def install_dirty_field_descriptors(model) -> None:
+    for field in model._meta.concrete_fields:
+        for klass in model.__mro__:
+            if field.attname in klass.__dict__:
+                descriptor = klass.__dict__[field.attname]
+                break
+        else:
+            continue
+
+        if not isinstance(descriptor, DirtyFieldDescriptor):
+            setattr(
+                model, field.attname, DirtyFieldDescriptor(field.attname, descriptor)
+            )
+
+
+def _on_class_prepared(sender, **kwargs) -> None:
+    if not issubclass(sender, LifecycleModelMixin):
+        return
+
+    if sender.lifecycle_state_class.tracks_assignments:
+        install_dirty_field_descriptors(sender)
+
+    if sender._snapshots_lazily():
+        sender._initial_state = LazyInitialStateDescriptor()
+
+    # Rather than on the first save, usually while handling a request
+    sender._discover_hooks()
+
+
 class LifecycleModelMixin:
+    # Engine used to track initial values. Set to `DirtyFieldsModelState` to
+    # record assignments through field descriptors instead of snapshotting.
+    lifecycle_state_class: type[ModelState] = ModelState
+
+    # Snapshot only the fields referenced by hook conditions, plus
+    # `lifecycle_extra_watched_fields`, instead of the whole instance __dict__.
+    # Other fields are captured the first time their initial value is asked for.
+    lifecycle_snapshot_watched_fields_only = False
+    lifecycle_extra_watched_fields: tuple[str, ...] = ()
+    # Re-fetch the related objects of watched dotted paths on every save, e.g.
+    # when they're modified by other processes or with QuerySet.update()
+    lifecycle_always_refresh_watched_fk = False
+    # Snapshot instances loaded from the database only when their initial
+    # state is first needed (`has_changed()`, `initial_value()`, `save()`...),
+    # from the values they were loaded with. Read-only iterations skip it.
+    lifecycle_lazy_snapshot = False
+    # Fields deferred with .only() or .defer() are left out of the snapshot.
+    # When a hook condition reads one, load it with a query ("load") or raise
+    # UnloadedFieldError ("raise").
+    lifecycle_deferred_fields = "load"
+    # Only write the fields that changed since the initial state, including
+    # those changed by BEFORE_* hooks, and skip the UPDATE if none did. Can
+    # be set per call with `save(only_changed=...)`.
+    lifecycle_save_only_changed = False
+    # Skip saves of instances that didn't change since the initial state: no
+    # transaction, no UPDATE, and only the AFTER_SAVE/AFTER_UPDATE hooks
+    # declared with `on_unchanged=True` fire. Counted in `skipped_saves`. Can
+    # be set per call with `save(skip_unchanged=...)`.
+    lifecycle_skip_unchanged_saves = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._initial_state = ModelState.from_instance(self)
+        if not defer_snapshot.get():
+            self._initial_state = self.lifecycle_state_class.from_instance(self)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        if not cls._snapshots_lazily():
+            return super().from_db(db, field_names, values)
+
+        token = defer_snapshot.set(True)
+        try:
+            instance = super().from_db(db, field_names, values)
+        finally:
+            defer_snapshot.reset(token)
+
+        # The loaded values are the initial state: keep them until it's needed
+        instance.__dict__["_lazy_snapshot"] = (field_names, values)
+        return instance
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _snapshots_lazily(cls) -> bool:
+        # Related objects of watched dotted paths must be snapshotted when
+        # loaded, and assignments are tracked from the start
+        return (
+            cls.lifecycle_lazy_snapshot
+            and not cls.lifecycle_state_class.tracks_assignments
+            and not cls._watched_fk_model_fields()
+        )
 
     def _snapshot_state(self) -> dict:
-        return ModelState.from_instance(self).initial_state
+        return dict(self.lifecycle_state_class.from_instance(self).initial_state)
 
     @property
     def _diff_with_initial(self) -> dict:
         return self._initial_state.get_diff(self)
 
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _concrete_field_names_by_attname(cls) -> dict[str, str]:
+        return {
+            field.attname: field.name
+            for field in cls._meta.concrete_fields
+            if not field.primary_key
+        }
+
+    def _get_changed_field_names(self) -> list[str] | None:
+        """
+        Names of the concrete fields whose value differs from the one last
+        written in the transaction, or from the initial state if they weren't
+        written. None if it can't be told because only watched fields were
+        snapshotted.
+        """
+        if self._initial_state.field_names is not None:
+            return None
+
+        field_names = self._concrete_field_names_by_attname()
+        written = self._written_values
+        return [
+            field_names[attname]
+            for attname in (
+                *self._diff_with_initial,
+                *self._initial_state.get_unknown_initial_field_names(self),
+            )
+            if attname in field_names and attname not in written
+        ] + [
+            field_names[attname]
+            for attname in self._get_unwritten_changes()
+            if attname in field_names
+        ]
+
+    @property
+    def _written_values(self) -> dict[str, Any]:
+        """
+        Values of the concrete fields as last written to the database, since
+        the initial state was reset: it only is once the transaction commits.
+        """
+        return self.__dict__.get("_written_values", {})
+
+    def _get_unwritten_changes(self) -> list[str]:
+        """Attnames of the written fields changed since they were written"""
+        instance_dict = self.__dict__
+        return [
+            attname
+            for attname, value in self._written_values.items()
+            if attname in instance_dict and instance_dict[attname] != value
+        ]
+
+    def _record_written_values(self, args: tuple, kwargs: dict) -> None:
+        """
+        Remember the values `save(*args, **kwargs)` just wrote, which later
+        writes in the same transaction are diffed against.
+        """
+        if args:
+            return
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            attnames = self._concrete_field_names_by_attname()
+        else:
+            attnames = [sanitize_field_name(self, name) for name in update_fields]
+
+        instance_dict = self.__dict__
+        mutable_types = self.lifecycle_state_class.mutable_types
+        written = instance_dict.setdefault("_written_values", {})
+        for attname in attnames:
+            if attname in instance_dict:
+                value = instance_dict[attname]
+                if isinstance(value, mutable_types):
+                    value = copy.deepcopy(value)
+                written[attname] = value
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _auto_now_field_names(cls) -> list[str]:
+        return [
+            field.name
+            for field in cls._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+
+    def _with_changed_update_fields(self, args: tuple, kwargs: dict) -> dict:
+        """
+        `kwargs` for `save()`, with the fields that changed since the initial
+        state as `update_fields`: an empty list if none did, which makes
+        Django skip the UPDATE. Left as is for inserts, when fields to update
+        are given, or when the changes can't be told.
+        """
+        if (
+            args
+            or self._state.adding
+            or kwargs.get("update_fields") is not None
+            or kwargs.get("force_insert")
+        ):
+            return kwargs
+
+        update_fields = self._get_changed_field_names()
+        if update_fields is None:
+            return kwargs
+
+        if update_fields:
+            # Django only sets them when they're written
+            for field_name in self._auto_now_field_names():
+                if field_name not in update_fields:
+                    update_fields.append(field_name)
+
+        return {**kwargs, "update_fields": update_fields}
+
+    def _is_unchanged_save(self, args: tuple, kwargs: dict) -> bool:
+        """
+        Whether `save()` would write the initial state again, with no hook
+        condition seeing a change, nor any field changed since it was last
+        written in the transaction. Inserts, forced saves, given fields to
+        update, and models snapshotting only watched fields never are.
+        """
+        if (
+            args
+            or self._state.adding
+            or kwargs.get("update_fields") is not None
+            or kwargs.get("force_insert")
+            or kwargs.get("force_update")
+            or self._initial_state.field_names is not None
+        ):
+            return False
+
+        # Related objects of watched dotted paths are part of the diff
+        self._clear_stale_watched_fk_model_cache()
+        return not (
+            self._diff_with_initial
+            or self._initial_state.get_unknown_initial_field_names(self)
+            or self._get_unwritten_changes()
+        )
+
+    def _is_concrete_attname(self, attname: str) -> bool:
+        return attname in self._concrete_field_names_by_attname()
+
+    def _is_deferred_field(self, attname: str) -> bool:
+        return attname not in self.__dict__ and self._is_concrete_attname(attname)
+
+    def _check_deferred_field_can_be_loaded(self, attname: str) -> None:
+        if self.lifecycle_deferred_fields == "raise":
+            raise UnloadedFieldError(
+                f"{self._meta.label}.{attname} is deferred and can't be loaded "
+                "to evaluate hook conditions"
+            )
+
+    def _load_deferred_field(self, attname: str) -> None:
+        self._check_deferred_field_can_be_loaded(attname)
+        # Django calls `refresh_from_db(fields=[attname])`
+        getattr(self, attname)
+
+    def _fetch_initial_value(self, attname: str) -> Any:
+        """Stored value of a field assigned before it was ever loaded"""
+        self._check_deferred_field_can_be_loaded(attname)
+        return (
+            self.__class__._base_manager.db_manager(self._state.db)
+            .filter(pk=self.pk)
+            .values_list(attname, flat=True)
+            .get()
+        )
+
     def _sanitize_field_name(self, field_name: str) -> str:
         return sanitize_field_name(self, field_name)
 
     def _current_value(self, field_name: str) -> Any:
+        attname = sanitize_field_name(self, split_field_path(field_name)[0])
+        if self._is_deferred_field(attname):
+            self._check_deferred_field_can_be_loaded(attname)
+
         return get_value(self, field_name)
 
     def initial_value(self, field_name: str) -> Any:
@@ -141,69 +629,231 @@ class LifecycleModelMixin:
             if field.is_relation and field.is_cached(self):
                 field.delete_cached_value(self)
 
+        self._initial_state.related_models_version = (
+            self._get_watched_related_models_version()
+        )
+
+    def _clear_stale_watched_fk_model_cache(self):
+        """
+        Only drop cached related objects if they may be stale: an instance of
+        a watched related model was saved or deleted since they were loaded,
+        or the FK no longer points to the snapshotted row.
+        """
+        watched_fk_models = self._watched_fk_models()
+        if not watched_fk_models:
+            return
+
+        version = self._initial_state.related_models_version
+        if (
+            self.lifecycle_always_refresh_watched_fk
+            or version is None
+            or version != self._get_watched_related_models_version()
+        ):
+            self._clear_watched_fk_model_cache()
+            return
+
+        for watched_field_name in watched_fk_models:
+            field = self._meta.get_field(watched_field_name)
+
+            if (
+                field.is_cached(self)
+                and getattr(field, "attname", None) is not None
+                and self._initial_state.has_changed(self, field.attname)
+            ):
+                field.delete_cached_value(self)
+
     def _reset_initial_state(self):
-        self._initial_state = ModelState.from_instance(self)
+        self.__dict__.pop("_lazy_snapshot", None)
+        self.__dict__.pop("_written_values", None)
+        self._initial_state = self.lifecycle_state_class.from_instance(self)
 
-    @transaction.atomic
     def save(self, *args, **kwargs):
         skip_hooks = kwargs.pop("skip_hooks", False)
-        save = super().save
+        only_changed = kwargs.pop("only_changed", self.lifecycle_save_only_changed)
+        skip_unchanged = kwargs.pop(
+            "skip_unchanged", self.lifecycle_skip_unchanged_saves
+        )
 
         skip_hooks_from_cm = _bypass_state.is_bypassed_for(self.__class__)
+        if skip_unchanged and self._is_unchanged_save(args, kwargs):
+            skipped_saves.increment(self.__class__)
+            if not (skip_hooks or skip_hooks_from_cm):
+                self._run_hooked_methods(AFTER_SAVE, unchanged=True)
+                self._run_hooked_methods(AFTER_UPDATE, unchanged=True)
+            return
+
         if skip_hooks or skip_hooks_from_cm:
-            save(*args, **kwargs)
+            if only_changed:
+                kwargs = self._with_changed_update_fields(args, kwargs)
+            super().save(*args, **kwargs)
+            self._record_written_values(args, kwargs)
             return
 
-        self._clear_watched_fk_model_cache()
+        if self._has_hooks_for(SAVE_HOOKS):
+            self._save_with_hooks(*args, only_changed=only_changed, **kwargs)
+        else:
+            # Nothing can fire: skip the transaction and the condition checks
+            if only_changed:
+                kwargs = self._with_changed_update_fields(args, kwargs)
+            super().save(*args, **kwargs)
+            self._record_written_values(args, kwargs)
+
+        # Registered once the savepoint of `_save_with_hooks` is released, so
+        # saves within the same transaction share a single callback
+        reset_initial_state_on_commit([self])
+
+    @transaction.atomic
+    def _save_with_hooks(
+        self, *args, only_changed=False, run_hooked_methods=None, **kwargs
+    ):
+        # `asave()` passes a runner awaiting coroutine hooked methods
+        run_hooked_methods = run_hooked_methods or self._run_hooked_methods
+        save = super().save
+        self._clear_stale_watched_fk_model_cache()
         is_new = self._state.adding
 
         if is_new:
-            self._run_hooked_methods(BEFORE_CREATE, **kwargs)
+            run_hooked_methods(BEFORE_CREATE, **kwargs)
         else:
-            self._run_hooked_methods(BEFORE_UPDATE, **kwargs)
+            run_hooked_methods(BEFORE_UPDATE, **kwargs)
 
-        self._run_hooked_methods(BEFORE_SAVE, **kwargs)
+        run_hooked_methods(BEFORE_SAVE, **kwargs)
+        if only_changed:
+            # Including the fields changed by BEFORE_* hooks
+            kwargs = self._with_changed_update_fields(args, kwargs)
         save(*args, **kwargs)
-        self._run_hooked_methods(AFTER_SAVE, **kwargs)
+        self._record_written_values(args, kwargs)
+        run_hooked_methods(AFTER_SAVE, **kwargs)
 
         if is_new:
-            self._run_hooked_methods(AFTER_CREATE, **kwargs)
+            run_hooked_methods(AFTER_CREATE, **kwargs)
         else:
-            self._run_hooked_methods(AFTER_UPDATE, **kwargs)
+            run_hooked_methods(AFTER_UPDATE, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        bypassed = _bypass_state.is_bypassed_for(self.__class__)
+        if bypassed or not self._has_hooks_for(DELETE_HOOKS):
+            return super().delete(*args, **kwargs)
 
-        transaction.on_commit(self._reset_initial_state)
+        return self._delete_with_hooks(*args, **kwargs)
 
     @transaction.atomic
-    def delete(self, *args, **kwargs):
-        self._run_hooked_methods(BEFORE_DELETE, **kwargs)
+    def _delete_with_hooks(self, *args, run_hooked_methods=None, **kwargs):
+        run_hooked_methods = run_hooked_methods or self._run_hooked_methods
+        run_hooked_methods(BEFORE_DELETE, **kwargs)
         value = super().delete(*args, **kwargs)
-        self._run_hooked_methods(AFTER_DELETE, **kwargs)
+        run_hooked_methods(AFTER_DELETE, **kwargs)
         return value
 
-    def refresh_from_db(self, *args, **kwargs):
-        super().refresh_from_db(*args, **kwargs)
-        self._initial_state = ModelState.from_instance(self)
+    async def asave(self, *args, **kwargs):
+        skip_hooks = kwargs.pop("skip_hooks", False)
+        skip_hooks = skip_hooks or _bypass_state.is_bypassed_for(self.__class__)
+        only_changed = kwargs.pop("only_changed", self.lifecycle_save_only_changed)
+        skip_unchanged = kwargs.pop(
+            "skip_unchanged", self.lifecycle_skip_unchanged_saves
+        )
+
+        if skip_hooks or not self._has_async_hooks_for(SAVE_HOOKS):
+            # Nothing to await: a single trip to the database thread
+            await sync_to_async(self.save)(
+                *args,
+                skip_hooks=skip_hooks,
+                only_changed=only_changed,
+                skip_unchanged=skip_unchanged,
+                **kwargs,
+            )
+            return
+
+        if skip_unchanged and await sync_to_async(self._is_unchanged_save)(
+            args, kwargs
+        ):
+            skipped_saves.increment(self.__class__)
+            await self._arun_hooked_methods(AFTER_SAVE, unchanged=True)
+            await self._arun_hooked_methods(AFTER_UPDATE, unchanged=True)
+            return
+
+        await sync_to_async(self._save_awaiting_hooks)(
+            *args, only_changed=only_changed, **kwargs
+        )
+
+    def _save_awaiting_hooks(self, *args, **kwargs):
+        """
+        Save with hooks in a single trip to the database thread, awaiting
+        coroutine hooked methods from it in the event loop: the transaction
+        is never left open while other tasks run their queries in that thread.
+        """
+        self._save_with_hooks(
+            *args, run_hooked_methods=async_to_sync(self._arun_hooked_methods), **kwargs
+        )
+        reset_initial_state_on_commit([self])
+
+    async def adelete(self, *args, **kwargs):
+        bypassed = _bypass_state.is_bypassed_for(self.__class__)
+        if bypassed or not self._has_async_hooks_for(DELETE_HOOKS):
+            return await sync_to_async(self.delete)(*args, **kwargs)
+
+        # Like `asave()`, in a single trip to the database thread
+        return await sync_to_async(self._delete_with_hooks)(
+            *args, run_hooked_methods=async_to_sync(self._arun_hooked_methods), **kwargs
+        )
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+
+        if fields is None:
+            self._reset_initial_state()
+        else:
+            # e.g. a deferred field being loaded: other changes are kept
+            self._initial_state.refresh_fields(self, fields)
+            for field_name in fields:
+                self._written_values.pop(sanitize_field_name(self, field_name), None)
 
     @classmethod
-    @lru_cache(typed=True)
+    @lru_cache(maxsize=None, typed=True)
     def _potentially_hooked_methods(cls):
-        skip = set(cls._get_unhookable_attribute_names())
-        collected = []
+        """
+        Hooked functions of the class, sorted by name. Class dicts are read
+        along the MRO instead of using getattr(), so that no descriptor
+        (properties, fields, related managers...) is evaluated.
+        """
+        attributes = {}
 
-        for name in dir(cls):
-            if name in skip:
-                continue
-            try:
-                attr = getattr(cls, name)
-                if isfunction(attr) and hasattr(attr, "_hooked"):
-                    collected.append(attr)
-            except AttributeError:
-                pass
+        for klass in cls.__mro__:
+            for name, attr in vars(klass).items():
+                # Attributes of subclasses shadow those of their bases
+                attributes.setdefault(name, attr)
 
-        return collected
+        return [
+            attributes[name]
+            for name in sorted(attributes)
+            if isfunction(attributes[name]) and hasattr(attributes[name], "_hooked")
+        ]
 
     @classmethod
-    @lru_cache(typed=True)
+    def _discover_hooks(cls) -> None:
+        """Fill the per-class caches of hooks, which need no app registry"""
+        cls._hook_dispatch_table()
+        cls._unchanged_hook_dispatch_table()
+        cls._watched_fk_models()
+
+        for hooks in (SAVE_HOOKS, DELETE_HOOKS):
+            cls._has_hooks_for(hooks)
+            cls._has_async_hooks_for(hooks)
+
+    @classmethod
+    def _warm_up(cls) -> None:
+        """Fill the remaining per-class caches, once the app registry is ready"""
+        cls._discover_hooks()
+        get_field_name_map(cls)
+        cls._concrete_field_names_by_attname()
+        cls._auto_now_field_names()
+        cls._snapshot_layout()
+        cls._snapshots_lazily()
+        cls._watched_related_models()
+        cls._watched_fk_prefetch_paths()
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
     def _watched_fk_model_fields(cls) -> list[str]:
         """
         Gather up all field names (values in 'when' key) that correspond to
@@ -220,39 +870,186 @@ class LifecycleModelMixin:
         return watched
 
     @classmethod
-    @lru_cache(typed=True)
+    def _get_watched_fk_path_relations(cls, watched_field_name: str) -> list[Any]:
+        """
+        Relation fields traversed by a watched dotted path, stopping at the
+        first attribute that isn't a forward relation.
+        """
+        model = cls
+        relations = []
+
+        for name in watched_field_name.split(".")[:-1]:
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                break
+
+            if not field.is_relation or field.one_to_many or field.many_to_many:
+                break
+
+            relations.append(field)
+            model = field.related_model
+            if model is None:
+                # Generic foreign keys can be prefetched but not traversed
+                break
+
+        return relations
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _watched_fk_prefetch_paths(cls) -> list[str]:
+        """
+        `prefetch_related` lookups loading the related objects traversed by
+        watched dotted paths, e.g. "organization" for "organization.name".
+        """
+        paths = []
+
+        for watched_field_name in cls._watched_fk_model_fields():
+            relations = cls._get_watched_fk_path_relations(watched_field_name)
+            path = "__".join(field.name for field in relations)
+            if path and path not in paths:
+                paths.append(path)
+
+        return paths
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _watched_related_models(cls) -> tuple[type, ...] | None:
+        """
+        Models whose instances are traversed by watched dotted paths, or None
+        if some can't be known (e.g. generic foreign keys). Saving or deleting
+        any of their instances marks cached related objects as stale.
+        """
+        models = []
+
+        for watched_field_name in cls._watched_fk_model_fields():
+            relations = cls._get_watched_fk_path_relations(watched_field_name)
+            if len(relations) != len(watched_field_name.split(".")) - 1:
+                return None
+
+            for field in relations:
+                if field.related_model is None:
+                    return None
+                models.append(field.related_model._meta.concrete_model)
+
+        track_related_model_versions(models)
+        return tuple(dict.fromkeys(models))
+
+    @classmethod
+    def _get_watched_related_models_version(cls) -> int | None:
+        models = cls._watched_related_models()
+        if models is None:
+            return None
+
+        return sum(_related_model_versions[model] for model in models)
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
     def _watched_fk_models(cls) -> list[str]:
         return [_.split(".")[0] for _ in cls._watched_fk_model_fields()]
 
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _snapshot_field_names(cls) -> frozenset[str] | None:
+        """
+        Attribute names to snapshot when only watched fields are tracked, or
+        None if the whole __dict__ must be copied. Falls back to None when a
+        hook condition doesn't tell which fields it reads.
+        """
+        if not cls.lifecycle_snapshot_watched_fields_only:
+            return None
+
+        watched = set(cls.lifecycle_extra_watched_fields)
+
+        for entries in cls._hook_dispatch_table().values():
+            for callback_specs, _ in entries:
+                field_names = get_watched_field_names(callback_specs.condition)
+                if field_names is None:
+                    return None
+                watched.update(field_names)
+
+        # Dotted paths are snapshotted separately; keep their FK column too
+        return frozenset(
+            sanitize_field_name(cls, field_name.split(".")[0]) for field_name in watched
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _snapshot_layout(cls) -> SnapshotLayout:
+        field_names = cls._snapshot_field_names()
+        if field_names is None:
+            attnames = [field.attname for field in cls._meta.concrete_fields]
+        else:
+            attnames = sorted(field_names)
+
+        return SnapshotLayout(tuple(attnames))
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _hook_dispatch_table(cls) -> HookDispatchTable:
+        return build_hook_dispatch_table(cls._potentially_hooked_methods())
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _unchanged_hook_dispatch_table(cls) -> HookDispatchTable:
+        """Entries of the dispatch table firing on skipped unchanged saves"""
+        return {
+            hook: [entry for entry in entries if entry[0].on_unchanged]
+            for hook, entries in cls._hook_dispatch_table().items()
+        }
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _has_hooks_for(cls, hooks: tuple[str, ...]) -> bool:
+        dispatch_table = cls._hook_dispatch_table()
+        return any(hook in dispatch_table for hook in hooks)
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _has_async_hooks_for(cls, hooks: tuple[str, ...]) -> bool:
+        dispatch_table = cls._hook_dispatch_table()
+        return any(
+            hooked_method.is_async
+            for hook in hooks
+            for _, hooked_method in dispatch_table.get(hook, ())
+        )
+
     def _get_hooked_methods(
-        self, hook: str, update_fields: Iterable[str] | None = None, **kwargs
+        self,
+        hook: str,
+        update_fields: Iterable[str] | None = None,
+        unchanged: bool = False,
+        **kwargs,
     ) -> list[AbstractHookedMethod]:
         """
-        Iterate through decorated methods to find those that should be
-        triggered by the current hook. If conditions exist, check them before
-        adding it to the list of methods to fire.
-
-        Then, sort the list.
+        Look up the methods registered for the current hook, already sorted by
+        priority, and keep those whose conditions pass. If `unchanged`, only
+        those declared with `on_unchanged=True` are looked up.
         """
+        if unchanged:
+            dispatch_table = self._unchanged_hook_dispatch_table()
+        else:
+            dispatch_table = self._hook_dispatch_table()
 
         hooked_methods = []
+        fired = set()
 
-        for method in self._potentially_hooked_methods():
-            for callback_specs in method._hooked:
-                if callback_specs.hook != hook:
-                    continue
-
-                if callback_specs.condition(self, update_fields=update_fields):
-                    hooked_method = instantiate_hooked_method(method, callback_specs)
-                    hooked_methods.append(hooked_method)
+        for callback_specs, hooked_method in dispatch_table.get(hook, ()):
+            # Only store the method once per hook
+            if hooked_method.method in fired:
+                continue
 
-                    # Only store the method once per hook
-                    break
+            if callback_specs.condition(self, update_fields=update_fields):
+                hooked_methods.append(hooked_method)
+                fired.add(hooked_method.method)
 
-        return sorted(hooked_methods)
+        return hooked_methods
 
     def _run_hooked_methods(self, hook: str, **kwargs) -> list[str]:
         """Run hooked methods"""
+        if hook_profiler.enabled:
+            return self._run_hooked_methods_profiled(hook, **kwargs)
+
         fired = []
 
         for method in self._get_hooked_methods(hook, **kwargs):
@@ -261,75 +1058,153 @@ class LifecycleModelMixin:
 
         return fired
 
-    @classmethod
-    def _get_model_property_names(cls) -> list[str]:
+    async def _arun_hooked_methods(self, hook: str, **kwargs) -> list[str]:
         """
-        Gather up properties and cached_properties which may be methods
-        that were decorated. Need to inspect class versions b/c doing
-        getattr on them could cause unwanted side effects.
+        Run hooked methods from async code. Conditions and sync hooked methods
+        run in the database thread, coroutine hooked methods are awaited.
+        Coroutine AFTER_* hooked methods of the same priority are independent
+        and run concurrently.
         """
-        property_names = []
+        profile = hook_profiler.enabled
+        if profile:
+            start = perf_counter()
 
-        for name in dir(cls):
-            attr = getattr(cls, name, None)
+        methods = await sync_to_async(self._get_hooked_methods)(hook, **kwargs)
 
-            if attr and (
-                isinstance(attr, property) or isinstance(attr, cached_property)
-            ):
-                property_names.append(name)
+        if profile:
+            condition_time = perf_counter() - start
+            runs = []
+
+        concurrent = hook.startswith("after_")
+        fired = []
+
+        async def run(method):
+            if profile:
+                start = perf_counter()
+            await method.arun(self)
+            if profile:
+                runs.append((method.name, 1, perf_counter() - start))
+
+        for (_, run_concurrently), group in groupby(
+            methods,
+            key=lambda method: (method.priority, concurrent and method.is_async),
+        ):
+            group = list(group)
+            if run_concurrently:
+                await gather_all(*(run(method) for method in group))
+            else:
+                for method in group:
+                    await run(method)
+            fired.extend(method.name for method in group)
+
+        if profile:
+            hook_profiler.record(
+                self.__class__,
+                hook,
+                calls=1,
+                considered=len(self._hook_dispatch_table().get(hook, ())),
+                condition_time=condition_time,
+                runs=runs,
+            )
+        return fired
+
+    def _run_hooked_methods_profiled(self, hook: str, **kwargs) -> list[str]:
+        start = perf_counter()
+        methods = self._get_hooked_methods(hook, **kwargs)
+        condition_time = perf_counter() - start
 
-        return property_names
+        fired = []
+        runs = []
+
+        for method in methods:
+            start = perf_counter()
+            method.run(self)
+            runs.append((method.name, 1, perf_counter() - start))
+            fired.append(method.name)
+
+        hook_profiler.record(
+            self.__class__,
+            hook,
+            calls=1,
+            considered=len(self._hook_dispatch_table().get(hook, ())),
+            condition_time=condition_time,
+            runs=runs,
+        )
+        return fired
 
     @classmethod
-    def _get_model_descriptor_names(cls) -> list[str]:
+    def _run_hooked_methods_in_batch(
+        cls, instances: list[LifecycleModelMixin], hook: str, **kwargs
+    ) -> list[str]:
         """
-        Attributes which are Django descriptors. These represent a field
-        which is a one-to-many or many-to-many relationship that is
-        potentially defined in another model, and doesn't otherwise appear
-        as a field on this model.
+        Evaluate the conditions of every instance first, then run each hooked
+        method once over the instances it fired for, in priority order.
+        Batch hooked methods receive all those instances in a single call.
         """
+        profile = hook_profiler.enabled
+        if profile:
+            start = perf_counter()
 
-        descriptor_names = []
+        batches = {}
 
-        for name in dir(cls):
-            attr = getattr(cls, name, None)
+        for instance in instances:
+            for method in instance._get_hooked_methods(hook, **kwargs):
+                batches.setdefault(id(method), (method, []))[1].append(instance)
 
-            if isinstance(attr, DJANGO_RELATED_FIELD_DESCRIPTOR_CLASSES):
-                descriptor_names.append(name)
+        if profile:
+            condition_time = perf_counter() - start
+            runs = []
 
-        return descriptor_names
+        fired = []
 
-    @classmethod
-    def _get_field_names(cls) -> list[str]:
-        names = []
+        for method, method_instances in sorted(
+            batches.values(), key=lambda batch: batch[0].priority
+        ):
+            if profile:
+                start = perf_counter()
+            method.run_batch(cls, method_instances)
+            if profile:
+                runs.append(
+                    (method.name, len(method_instances), perf_counter() - start)
+                )
+            fired.append(method.name)
 
-        for f in cls._meta.get_fields():
-            names.append(f.name)
+        if profile:
+            hook_profiler.record(
+                cls,
+                hook,
+                calls=len(instances),
+                considered=len(cls._hook_dispatch_table().get(hook, ()))
+                * len(instances),
+                condition_time=condition_time,
+                runs=runs,
+            )
 
-            field = cls._meta.get_field(f.name)
-            try:
-                internal_type = field.get_internal_type()
-            except AttributeError:
-                continue
+        return fired
 
-            if internal_type == "ForeignKey" or internal_type == "OneToOneField":
-                names.append(f.name + "_id")
 
-        return names
-
-    @classmethod
-    def _get_unhookable_attribute_names(cls) -> list[str]:
-        return (
-            cls._get_field_names()
-            + cls._get_model_descriptor_names()
-            + cls._get_model_property_names()
-            + ["_run_hooked_methods"]
-        )
+class_prepared.connect(_on_class_prepared)
 
 
 T = TypeVar("T", bound=LifecycleHookBypass)
 
 
+def warm_up(models: Iterable[type] | None = None) -> None:
+    """
+    Fill what lifecycle models cache per class, for all installed models or
+    the given ones, instead of on their first save. Hooks are already
+    discovered when classes are created; the rest needs the app registry,
+    e.g. call it from `AppConfig.ready()`. Caches filled before forking
+    worker processes are shared by them.
+    """
+    if models is None:
+        models = apps.get_models()
+
+    for model in models:
+        if issubclass(model, LifecycleModelMixin):
+            model._warm_up()
+
+
 @contextmanager
 def bypass_hooks_for(models: Iterable[T]):
     try:
@@ -1,45 +1,351 @@
 from __future__ import annotations
+
+import copy
+from collections.abc import MutableMapping
+from contextvars import ContextVar
+from operator import itemgetter
 from typing import Any
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
 from typing import TYPE_CHECKING
 
+from django.db.models import DEFERRED
+
 from django_lifecycle.utils import get_value
 from django_lifecycle.utils import sanitize_field_name
+from django_lifecycle.utils import split_field_path
 
 if TYPE_CHECKING:
     from django_lifecycle import LifecycleModelMixin
 
+# Set to a model and a list while a queryset builds instances of that model
+# whose related objects it will prefetch in batch. The instances are collected
+# in the list and their watched FK values are snapshotted afterwards.
+defer_related_fields_snapshot: ContextVar[Optional[Tuple[type, list]]] = ContextVar(
+    "defer_related_fields_snapshot", default=None
+)
+
+
+def _defers_related_fields_snapshot(instance: LifecycleModelMixin) -> bool:
+    deferred = defer_related_fields_snapshot.get()
+    # Instances of other models (e.g. loaded by `select_related`) aren't prefetched for
+    if deferred is None or type(instance) is not deferred[0]:
+        return False
+
+    deferred[1].append(instance)
+    return True
+
+
+# Set while `LifecycleModelMixin.from_db` builds an instance whose snapshot is
+# created lazily from the loaded values.
+defer_snapshot: ContextVar[bool] = ContextVar("defer_snapshot", default=False)
+
+
+# Attributes of model instances that are never part of their initial state
+INTERNAL_ATTRIBUTES = (
+    "_state",
+    "_potentially_hooked_methods",
+    "_initial_state",
+    "_watched_fk_model_fields",
+    "_lazy_snapshot",
+    "_written_values",
+)
+
+
+class SnapshotLayout:
+    """
+    Attribute names whose initial values are stored in a tuple, shared by all
+    the snapshots of a model class.
+    """
+
+    __slots__ = ("attnames", "index", "_getter", "_matched_attnames")
+
+    def __init__(self, attnames: tuple[str, ...]):
+        self.attnames = attnames
+        self.index = {attname: i for i, attname in enumerate(attnames)}
+        # itemgetter() returns a bare value, not a tuple, for a single item
+        self._getter = itemgetter(*attnames) if len(attnames) > 1 else None
+        self._matched_attnames = None
+
+    def __len__(self) -> int:
+        return len(self.attnames)
+
+    def values_from(self, instance_dict: dict) -> tuple[tuple, bool]:
+        """
+        Values of the layout's attributes, DEFERRED for the missing ones, and
+        whether none is missing.
+        """
+        try:
+            if self._getter is not None:
+                return self._getter(instance_dict), True
+            return tuple(instance_dict[attname] for attname in self.attnames), True
+        except KeyError:
+            return (
+                tuple(
+                    instance_dict.get(attname, DEFERRED) for attname in self.attnames
+                ),
+                False,
+            )
+
+    def matches(self, attnames: list[str]) -> bool:
+        # Querysets pass the same list of attnames for each row they load
+        if attnames is self._matched_attnames:
+            return True
+
+        if tuple(attnames) == self.attnames:
+            self._matched_attnames = attnames
+            return True
+
+        return False
+
+
+_EMPTY_LAYOUT = SnapshotLayout(())
+
+
+class Snapshot(MutableMapping):
+    """
+    Initial values of an instance, keyed by attribute name. Values of the
+    attributes of the class layout are kept in a tuple, DEFERRED for the
+    missing ones. Other keys (e.g. dotted paths) and values recorded later go
+    to a dict created when needed.
+    """
+
+    __slots__ = ("layout", "values", "extra")
+
+    def __init__(
+        self,
+        layout: SnapshotLayout = _EMPTY_LAYOUT,
+        values: tuple = (),
+        extra: dict[str, Any] | None = None,
+    ):
+        self.layout = layout
+        self.values = values
+        self.extra = extra
+
+    def __getitem__(self, key: str) -> Any:
+        extra = self.extra
+        if extra is not None and key in extra:
+            return extra[key]
+
+        i = self.layout.index.get(key)
+        if i is not None:
+            value = self.values[i]
+            if value is not DEFERRED:
+                return value
+
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        extra = self.extra
+        if extra is not None and key in extra:
+            return True
+
+        i = self.layout.index.get(key)
+        return i is not None and self.values[i] is not DEFERRED
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self.extra is None:
+            self.extra = {}
+        self.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        found = False
+
+        if self.extra is not None and key in self.extra:
+            del self.extra[key]
+            found = True
+
+        i = self.layout.index.get(key)
+        if i is not None and self.values[i] is not DEFERRED:
+            values = list(self.values)
+            values[i] = DEFERRED
+            self.values = tuple(values)
+            found = True
+
+        if not found:
+            raise KeyError(key)
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        extra = self.extra
+
+        for attname, value in zip(self.layout.attnames, self.values):
+            if value is DEFERRED or (extra is not None and attname in extra):
+                continue
+            yield attname, value
+
+        if extra is not None:
+            yield from extra.items()
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self.items():
+            yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+    def __repr__(self) -> str:
+        return f"Snapshot({dict(self.items())!r})"
+
 
 class ModelState:
-    def __init__(self, initial_state: dict[str, Any]):
+    # Whether descriptors recording field assignments must be installed
+    tracks_assignments = False
+    # Types of values copied when snapshotted, as they may be changed in place
+    mutable_types: tuple[type, ...] = ()
+
+    __slots__ = ("initial_state", "field_names", "related_models_version")
+
+    def __init__(
+        self,
+        initial_state: MutableMapping[str, Any],
+        field_names: frozenset[str] | None = None,
+    ):
         self.initial_state = initial_state
+        # Names snapshotted up front, or None when the whole __dict__ was copied
+        self.field_names = field_names
+        # Version of the watched related models when their cached instances
+        # were loaded, see `LifecycleModelMixin._clear_stale_watched_fk_model_cache`
+        self.related_models_version = None
 
     @classmethod
     def from_instance(cls, instance: LifecycleModelMixin) -> ModelState:
-        state = instance.__dict__.copy()
+        field_names = instance._snapshot_field_names()
+        layout = instance._snapshot_layout()
+        instance_dict = instance.__dict__
+        values, complete = layout.values_from(instance_dict)
+        extra = None
+
+        if field_names is None:
+            # Attributes other than concrete fields are snapshotted too
+            loaded = len(layout) if complete else len(layout) - values.count(DEFERRED)
+            internal = sum(name in instance_dict for name in INTERNAL_ATTRIBUTES)
+
+            if len(instance_dict) - internal > loaded:
+                extra = {
+                    name: value
+                    for name, value in instance_dict.items()
+                    if name not in layout.index and name not in INTERNAL_ATTRIBUTES
+                }
+
+        model_state = cls(Snapshot(layout, values, extra), field_names=field_names)
+        if not _defers_related_fields_snapshot(instance):
+            model_state.snapshot_related_fields(instance)
+
+        return model_state
+
+    @classmethod
+    def from_db_values(
+        cls, instance: LifecycleModelMixin, attnames: list[str], values: tuple
+    ) -> ModelState:
+        """
+        Snapshot of an instance as it was loaded from the database, built from
+        the values `from_db` received. Same as `from_instance` right after
+        loading, but it can be taken later.
+        """
+        field_names = instance._snapshot_field_names()
+        layout = instance._snapshot_layout()
 
+        if field_names is None and layout.matches(attnames):
+            # All fields were loaded: the tuple is stored as is
+            values = tuple(values)
+        else:
+            values, _ = layout.values_from(dict(zip(attnames, values)))
+
+        model_state = cls(Snapshot(layout, values), field_names=field_names)
+        model_state.snapshot_related_fields(instance)
+        return model_state
+
+    def snapshot_related_fields(self, instance: LifecycleModelMixin) -> None:
+        """Snapshot the watched fields of FK-related models (dotted paths)"""
+        self.related_models_version = instance._get_watched_related_models_version()
         for watched_related_field in instance._watched_fk_model_fields():
-            state[watched_related_field] = get_value(instance, watched_related_field)
+            # Don't load a deferred FK just to snapshot what it points to
+            root = split_field_path(watched_related_field)[0]
+            if instance._is_deferred_field(sanitize_field_name(instance, root)):
+                continue
+
+            self.initial_state[watched_related_field] = get_value(
+                instance, watched_related_field
+            )
+
+    def refresh_fields(self, instance: LifecycleModelMixin, field_names) -> None:
+        """Record the values of fields just loaded from the database as initial"""
+        instance_dict = instance.__dict__
+
+        for field_name in field_names:
+            attname = sanitize_field_name(instance, field_name)
+            if attname in instance_dict:
+                self.initial_state[attname] = instance_dict[attname]
+
+    def get_unknown_initial_field_names(self, instance: LifecycleModelMixin) -> list:
+        """
+        Fields deferred when snapshotted and assigned before being loaded, so
+        their initial value is unknown until it's fetched.
+        """
+        if self.field_names is not None:
+            return []
+
+        instance_dict = instance.__dict__
+        return [
+            attname
+            for attname in instance._concrete_field_names_by_attname()
+            if attname not in self.initial_state and attname in instance_dict
+        ]
+
+    def record_assignment(self, attname: str, old_value: Any) -> None:
+        """Called by tracking descriptors before a field is assigned"""
+
+    def _capture(self, instance: LifecycleModelMixin, field_name: str) -> None:
+        """
+        Lazily snapshot a field that was left out of a partial snapshot. The
+        value is taken as it is now, on first access.
+        """
+        if self.field_names is None or field_name in self.initial_state:
+            return
 
-        fields_to_remove = (
-            "_state",
-            "_potentially_hooked_methods",
-            "_initial_state",
-            "_watched_fk_model_fields",
-        )
-        for field in fields_to_remove:
-            state.pop(field, None)
+        if "." in field_name:
+            self.initial_state[field_name] = get_value(instance, field_name)
+        elif field_name in instance.__dict__:
+            self.initial_state[field_name] = instance.__dict__[field_name]
 
-        return ModelState(state)
+    def _resolve_deferred(
+        self, instance: LifecycleModelMixin, field_name: str, load: bool
+    ) -> None:
+        """
+        Get the initial value of a field that was deferred when snapshotted:
+        fetch it if the field was assigned since, or load the field if `load`.
+        A field never loaded nor assigned can't have changed.
+        """
+        if field_name in self.initial_state or not instance._is_concrete_attname(
+            field_name
+        ):
+            return
+
+        if field_name in instance.__dict__:
+            self.initial_state[field_name] = instance._fetch_initial_value(field_name)
+        elif load:
+            # Recorded as initial value by `refresh_fields`
+            instance._load_deferred_field(field_name)
 
     def get_diff(self, instance: LifecycleModelMixin) -> dict:
-        current = ModelState.from_instance(instance).initial_state
+        instance_dict = instance.__dict__
         diffs = {}
 
         for key, initial_value in self.initial_state.items():
-            try:
-                current_value = current[key]
-            except KeyError:
-                continue
+            if "." in key:
+                current_value = get_value(instance, key)
+            else:
+                try:
+                    current_value = instance_dict[key]
+                except KeyError:
+                    continue
 
             if initial_value != current_value:
                 diffs[key] = (initial_value, current_value)
@@ -51,6 +357,8 @@ class ModelState:
         Get initial value of field when model was instantiated.
         """
         field_name = sanitize_field_name(instance, field_name)
+        self._capture(instance, field_name)
+        self._resolve_deferred(instance, field_name, load=True)
         return self.initial_state.get(field_name)
 
     def has_changed(self, instance: LifecycleModelMixin, field_name: str) -> bool:
@@ -58,4 +366,127 @@ class ModelState:
         Check if a field has changed since the model was instantiated.
         """
         field_name = sanitize_field_name(instance, field_name)
+        self._capture(instance, field_name)
+        self._resolve_deferred(instance, field_name, load=False)
         return field_name in self.get_diff(instance)
+
+
+class DirtyFieldsModelState(ModelState):
+    """
+    Model state kept up to date by descriptors intercepting assignments to
+    concrete fields (see `LifecycleModelMixin.lifecycle_state_class`).
+
+    Only the value a field had before its first assignment is kept, so
+    `has_changed()` doesn't need to snapshot the whole instance. Values of
+    mutable types can change in place without being assigned: they are copied
+    up front and compared by value instead.
+    """
+
+    tracks_assignments = True
+    mutable_types = (dict, list, set, bytearray)
+
+    __slots__ = ("original_values",)
+
+    def __init__(
+        self,
+        initial_state: dict[str, Any],
+        field_names: frozenset[str] | None = None,
+    ):
+        super().__init__(initial_state, field_names=field_names)
+        self.original_values = {}
+
+    @classmethod
+    def from_instance(cls, instance: LifecycleModelMixin) -> DirtyFieldsModelState:
+        instance_dict = instance.__dict__
+        state = {}
+
+        for field in instance._meta.concrete_fields:
+            value = instance_dict.get(field.attname)
+            if isinstance(value, cls.mutable_types):
+                state[field.attname] = copy.deepcopy(value)
+
+        model_state = cls(state)
+        if not _defers_related_fields_snapshot(instance):
+            model_state.snapshot_related_fields(instance)
+
+        return model_state
+
+    def record_assignment(self, attname: str, old_value: Any) -> None:
+        if attname in self.original_values or attname in self.initial_state:
+            return
+
+        # `old_value` is DEFERRED when the field wasn't loaded yet
+        self.original_values[attname] = old_value
+
+    def refresh_fields(self, instance: LifecycleModelMixin, field_names) -> None:
+        instance_dict = instance.__dict__
+
+        for field_name in field_names:
+            attname = sanitize_field_name(instance, field_name)
+            self.original_values.pop(attname, None)
+            value = instance_dict.get(attname)
+
+            if isinstance(value, self.mutable_types):
+                self.initial_state[attname] = copy.deepcopy(value)
+            else:
+                self.initial_state.pop(attname, None)
+
+    def get_unknown_initial_field_names(self, instance: LifecycleModelMixin) -> list:
+        # Fetched when diffing
+        return []
+
+    def _changed_value(
+        self, instance: LifecycleModelMixin, field_name: str
+    ) -> tuple[Any, Any] | None:
+        if field_name in self.original_values:
+            initial_value = self.original_values[field_name]
+            if initial_value is DEFERRED:
+                initial_value = self.original_values[field_name] = (
+                    instance._fetch_initial_value(field_name)
+                )
+        elif field_name in self.initial_state:
+            initial_value = self.initial_state[field_name]
+        else:
+            return None
+
+        if "." in field_name:
+            current_value = get_value(instance, field_name)
+        else:
+            current_value = instance.__dict__.get(field_name)
+
+        if initial_value != current_value:
+            return initial_value, current_value
+
+        return None
+
+    def get_diff(self, instance: LifecycleModelMixin) -> dict:
+        diffs = {}
+
+        for key in (*self.original_values, *self.initial_state):
+            changed = self._changed_value(instance, key)
+            if changed is not None:
+                diffs[key] = changed
+
+        return diffs
+
+    def get_value(self, instance: LifecycleModelMixin, field_name: str) -> Any:
+        field_name = sanitize_field_name(instance, field_name)
+
+        if field_name in self.original_values:
+            if self.original_values[field_name] is DEFERRED:
+                self.original_values[field_name] = instance._fetch_initial_value(
+                    field_name
+                )
+            return self.original_values[field_name]
+
+        if field_name in self.initial_state:
+            return self.initial_state[field_name]
+
+        if instance._is_deferred_field(field_name):
+            instance._load_deferred_field(field_name)
+
+        return instance.__dict__.get(field_name)
+
+    def has_changed(self, instance: LifecycleModelMixin, field_name: str) -> bool:
+        field_name = sanitize_field_name(instance, field_name)
+        return self._changed_value(instance, field_name) is not None
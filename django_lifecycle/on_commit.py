@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import TYPE_CHECKING
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db import transaction
+
+if TYPE_CHECKING:
+    from django_lifecycle import LifecycleModelMixin
+
+# Attributes of an instance holding its initial state, or the values it's
+# lazily built from
+_INITIAL_STATE_ATTRIBUTES = ("_initial_state", "_lazy_snapshot")
+
+
+def _get_initial_state(instance: Any) -> tuple:
+    instance_dict = instance.__dict__
+    return tuple(instance_dict.get(name) for name in _INITIAL_STATE_ATTRIBUTES)
+
+
+def _set_initial_state(instance: Any, state: tuple) -> None:
+    for name, value in zip(_INITIAL_STATE_ATTRIBUTES, state):
+        if value is None:
+            instance.__dict__.pop(name, None)
+        else:
+            instance.__dict__[name] = value
+
+
+def _is_initial_state(instance: Any, state: tuple) -> bool:
+    return all(a is b for a, b in zip(_get_initial_state(instance), state))
+
+
+@contextmanager
+def _pinned_initial_states(pins: Iterable[tuple[Any, tuple]]) -> Iterator[None]:
+    replaced = []
+    for instance, state in pins:
+        current = _get_initial_state(instance)
+        if not _is_initial_state(instance, state):
+            _set_initial_state(instance, state)
+            replaced.append((instance, state, current))
+
+    try:
+        yield
+    finally:
+        for instance, state, current in replaced:
+            # Unless reset meanwhile, e.g. by saving the instance again
+            if _is_initial_state(instance, state):
+                _set_initial_state(instance, current)
+
+
+def with_initial_states(func: Callable, instances: Iterable[Any]) -> Callable:
+    """
+    `func`, run with the initial states `instances` have now. All instances
+    saved in a transaction are reset by one callback, which may run before
+    the on_commit hooked methods registered after it.
+    """
+    pins = [(instance, _get_initial_state(instance)) for instance in instances]
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        with _pinned_initial_states(pins):
+            return func(*args, **kwargs)
+
+    return run
+
+
+class InitialStateReset:
+    """
+    `on_commit` callback resetting the initial state of the instances saved
+    in a transaction. Instances are only weakly referenced, and each of them
+    is reset once no matter how many times it was saved.
+    """
+
+    def __init__(self):
+        self.instances = weakref.WeakValueDictionary()
+        self.done = False
+
+    def add(self, instances: Iterable[LifecycleModelMixin]) -> None:
+        for instance in instances:
+            self.instances[id(instance)] = instance
+
+    def __call__(self) -> None:
+        self.done = True
+        for instance in list(self.instances.values()):
+            instance._reset_initial_state()
+        self.instances.clear()
+
+
+# Callbacks pending in the current transaction of each connection, weakly
+# referenced: they're retired once run on commit, or once Django drops them
+# along with the transaction or savepoint they were registered in on rollback.
+# Transactions that never commit, e.g. the one wrapping a `TestCase` test,
+# keep sharing them until rolled back.
+_pending = threading.local()
+
+
+def _on_commit_once(
+    key: Hashable,
+    factory: Callable[[], Any],
+    instances: Iterable[Any],
+    using: str | None,
+) -> None:
+    alias = using or DEFAULT_DB_ALIAS
+    pending = getattr(_pending, alias, None)
+    if pending is None:
+        pending = weakref.WeakValueDictionary()
+        setattr(_pending, alias, pending)
+
+    callback = pending.get(key)
+    if callback is not None and not callback.done:
+        callback.add(instances)
+        return
+
+    callback = factory()
+    callback.add(instances)
+    transaction.on_commit(callback, using=using)
+    # Outside of transactions, it has already run
+    if not callback.done:
+        pending[key] = callback
+
+
+def reset_initial_state_on_commit(
+    instances: Iterable[LifecycleModelMixin], using: str | None = None
+) -> None:
+    """
+    Reset the initial state of `instances` once the current transaction is
+    committed, like `transaction.on_commit(instance._reset_initial_state)`,
+    sharing one callback with the other instances saved in the transaction.
+
+    The callback belongs to the transaction or savepoint it was registered
+    in: instances saved in a savepoint rolled back after that are still
+    reset, just like their changes are kept in memory.
+    """
+    _on_commit_once(InitialStateReset, InitialStateReset, instances, using)
+
+
+def _instance_key(instance: Any) -> tuple:
+    # Instances have no pk anymore once deleted
+    if instance.pk is None:
+        return ("id", id(instance))
+
+    return ("pk", instance.pk)
+
+
+class PendingOnCommitCall:
+    """
+    `on_commit` callback calling `func(model, instances)` with the instances
+    of the calls merged by `run_once_on_commit`, one per row.
+    """
+
+    def __init__(self, func: Callable[[Any, list], None], model: Any):
+        self.func = func
+        self.model = model
+        self.__name__ = getattr(func, "__name__", "run_once_on_commit")
+        self.pins: dict[tuple, tuple[Any, tuple]] = {}
+        self.done = False
+
+    def add(self, instances: Iterable[Any]) -> None:
+        for instance in instances:
+            self.pins[_instance_key(instance)] = (
+                instance,
+                _get_initial_state(instance),
+            )
+
+    def __call__(self) -> None:
+        self.done = True
+        pins = list(self.pins.values())
+        with _pinned_initial_states(pins):
+            self.func(self.model, [instance for instance, _ in pins])
+
+
+def run_once_on_commit(
+    key: Hashable,
+    func: Callable[[Any, list], None],
+    model: Any,
+    instances: Iterable[Any],
+    using: str | None = None,
+) -> None:
+    """
+    Call `func(model, instances)` once the current transaction is committed.
+
+    Calls made with the same `key` within the transaction are merged into the
+    first one, and each row is passed once: as the last instance given for
+    its primary key, in its state at commit time. Instances whose saves were
+    rolled back with a savepoint may still be passed if the call was already
+    pending before it.
+    """
+    _on_commit_once(key, partial(PendingOnCommitCall, func, model), instances, using)
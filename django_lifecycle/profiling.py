@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import copy
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Tuple
+
+
+@dataclass
+class HookedMethodStats:
+    calls: int = 0
+    run_time: float = 0.0
+
+
+@dataclass
+class HookStats:
+    # Number of instances the hook ran for
+    calls: int = 0
+    # Hook configurations whose condition could be evaluated, and methods fired
+    considered: int = 0
+    fired: int = 0
+    # Seconds spent evaluating conditions and running hooked methods. For
+    # on_commit hooks, run time only covers scheduling them.
+    condition_time: float = 0.0
+    run_time: float = 0.0
+    methods: Dict[str, HookedMethodStats] = field(default_factory=dict)
+
+
+class HookProfiler:
+    """
+    Collects timings of hook phases per model and hook when enabled. When
+    disabled, the only cost left in the save path is checking `enabled`.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._stats: Dict[Tuple[str, str], HookStats] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+
+    def snapshot(self) -> Dict[Tuple[str, str], HookStats]:
+        """Copy of the stats collected so far, keyed by (model label, hook)"""
+        with self._lock:
+            return copy.deepcopy(self._stats)
+
+    def record(
+        self,
+        model: Any,
+        hook: str,
+        calls: int,
+        considered: int,
+        condition_time: float,
+        runs: Iterable[Tuple[str, int, float]],
+    ) -> None:
+        """
+        Record a hook phase. `runs` holds (method name, calls, run time) for
+        each hooked method fired.
+        """
+        key = (model._meta.label, hook)
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = HookStats()
+
+            stats.calls += calls
+            stats.considered += considered
+            stats.condition_time += condition_time
+
+            for name, method_calls, run_time in runs:
+                method_stats = stats.methods.get(name)
+                if method_stats is None:
+                    method_stats = stats.methods[name] = HookedMethodStats()
+
+                method_stats.calls += method_calls
+                method_stats.run_time += run_time
+                stats.fired += method_calls
+                stats.run_time += run_time
+
+
+class SkippedSaveCounter:
+    """
+    Counts the saves skipped because nothing changed, per model. Always
+    collected: counting costs far less than the transaction it replaces.
+    """
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, model: Any) -> None:
+        label = model._meta.label
+
+        with self._lock:
+            self._counts[label] = self._counts.get(label, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = {}
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of the counts so far, keyed by model label"""
+        with self._lock:
+            return dict(self._counts)
+
+
+hook_profiler = HookProfiler()
+skipped_saves = SkippedSaveCounter()
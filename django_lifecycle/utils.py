@@ -1,26 +1,48 @@
+from functools import lru_cache
 from functools import reduce
 from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import Type
 
-from django.core.exceptions import FieldDoesNotExist
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 
 
-def sanitize_field_name(instance: models.Model, field_name: str) -> str:
-    try:
-        field = instance._meta.get_field(field_name)
+@lru_cache(maxsize=None)
+def get_field_name_map(model: Type[models.Model]) -> Dict[str, str]:
+    """
+    Map every name a field can be referred to by (its name or attname) to the
+    attribute holding its value, which is the `_id` attname for foreign keys
+    and one-to-one fields. Built once per model class.
+    """
+    field_name_map = {}
+
+    for field in model._meta.get_fields(include_hidden=True):
+        names = {field.name, getattr(field, "attname", field.name)}
 
         try:
             internal_type = field.get_internal_type()
         except AttributeError:
-            return field
-        if internal_type == "ForeignKey" or internal_type == "OneToOneField":
-            if not field_name.endswith("_id"):
-                return field_name + "_id"
-    except FieldDoesNotExist:
-        pass
+            internal_type = None
+        is_fk = internal_type == "ForeignKey" or internal_type == "OneToOneField"
+
+        for name in names:
+            if is_fk and not name.endswith("_id"):
+                field_name_map[name] = name + "_id"
+            else:
+                field_name_map[name] = name
+
+    return field_name_map
 
-    return field_name
+
+@lru_cache(maxsize=None)
+def split_field_path(field_path: str) -> Tuple[str, ...]:
+    return tuple(field_path.split("."))
+
+
+def sanitize_field_name(instance: models.Model, field_name: str) -> str:
+    return get_field_name_map(instance._meta.model).get(field_name, field_name)
 
 
 def get_value(instance, sanitized_field_name: str) -> Any:
@@ -32,6 +54,6 @@ def get_value(instance, sanitized_field_name: str) -> Any:
             except (AttributeError, ObjectDoesNotExist):
                 return None
 
-        return reduce(getitem, sanitized_field_name.split("."), instance)
+        return reduce(getitem, split_field_path(sanitized_field_name), instance)
     else:
         return getattr(instance, sanitize_field_name(instance, sanitized_field_name))
@@ -1,5 +1,9 @@
-import inspect
+from inspect import isfunction
+from typing import Callable
+from typing import Dict
 from typing import Iterable
+from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -19,15 +23,64 @@ def get_models_to_check(
         yield from app_config.get_models()
 
 
-def model_has_hooked_methods(model: Type[models.Model]) -> bool:
-    for attribute_name, attribute in inspect.getmembers(
-        model, predicate=inspect.isfunction
-    ):
-        if hasattr(attribute, "_hooked"):
+def is_defined_in_class(function) -> bool:
+    owner = function.__qualname__.rpartition(".")[0]
+    return bool(owner) and not owner.endswith("<locals>")
+
+
+def get_classes_defining_hooked_methods() -> Set[Tuple[str, str]]:
+    """(module, qualified name) of the classes defining hooked methods"""
+    from django_lifecycle.decorators import hooked_functions
+
+    return {
+        (function.__module__, function.__qualname__.rpartition(".")[0])
+        for function in list(hooked_functions)
+        if is_defined_in_class(function)
+    }
+
+
+def get_hooked_functions_defined_outside_classes() -> Dict[int, Callable]:
+    """
+    Hooked functions whose qualified name doesn't tell a class, e.g. defined
+    at module level and assigned in class bodies, by id
+    """
+    from django_lifecycle.decorators import hooked_functions
+
+    return {
+        id(function): function
+        for function in list(hooked_functions)
+        if not is_defined_in_class(function)
+    }
+
+
+def model_may_have_hooked_methods(
+    model: Type[models.Model],
+    classes: Set[Tuple[str, str]],
+    functions: Dict[int, Callable],
+) -> bool:
+    for klass in model.__mro__:
+        if (klass.__module__, klass.__qualname__) in classes:
             return True
+
+        if functions and any(id(value) in functions for value in vars(klass).values()):
+            return True
+
     return False
 
 
+def model_has_hooked_methods(model: Type[models.Model]) -> bool:
+    # Class dicts are read rather than attributes, which may be descriptors
+    attributes = {}
+    for klass in model.__mro__:
+        for name, attribute in vars(klass).items():
+            attributes.setdefault(name, attribute)
+
+    return any(
+        isfunction(attribute) and hasattr(attribute, "_hooked")
+        for attribute in attributes.values()
+    )
+
+
 def model_has_lifecycle_mixin(model: Type[models.Model]) -> bool:
     from django_lifecycle.mixins import LifecycleModelMixin
 
@@ -37,8 +90,19 @@ def model_has_lifecycle_mixin(model: Type[models.Model]) -> bool:
 def check_models_with_hooked_methods_inherit_from_lifecycle(
     app_configs: Union[Iterable[AppConfig], None] = None, **kwargs
 ):
+    classes = get_classes_defining_hooked_methods()
+    functions = get_hooked_functions_defined_outside_classes()
+    if not classes and not functions:
+        return
+
+    # Only models inheriting from a class defining hooked methods, or holding
+    # hooked functions defined elsewhere, are inspected
     for model in get_models_to_check(app_configs):
-        if model_has_hooked_methods(model) and not model_has_lifecycle_mixin(model):
+        if (
+            model_may_have_hooked_methods(model, classes, functions)
+            and not model_has_lifecycle_mixin(model)
+            and model_has_hooked_methods(model)
+        ):
             yield Error(
                 "Model has hooked methods but it doesn't inherit from LifecycleModelMixin",
                 id="django_lifecycle.E001",
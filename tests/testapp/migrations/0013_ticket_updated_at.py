@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("testapp", "0012_ticket"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticket",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
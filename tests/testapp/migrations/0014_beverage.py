@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:04
+
+import django_lifecycle.mixins
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("testapp", "0013_ticket_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Beverage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("price", models.IntegerField(default=0)),
+                ("price_changes", models.IntegerField(default=0)),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=(django_lifecycle.mixins.LifecycleModelMixin, models.Model),
+        ),
+    ]
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -8,9 +9,18 @@ from django.utils import timezone
 from django.utils.functional import cached_property
 from urlman import Urls
 
+from django_lifecycle import AFTER_CREATE
+from django_lifecycle import AFTER_DELETE
 from django_lifecycle import AFTER_SAVE
 from django_lifecycle import AFTER_UPDATE
+from django_lifecycle import BEFORE_CREATE
+from django_lifecycle import BEFORE_SAVE
+from django_lifecycle import BEFORE_UPDATE
+from django_lifecycle import LifecycleManager
 from django_lifecycle import hook
+from django_lifecycle.conditions import WhenFieldHasChanged
+from django_lifecycle.conditions import WhenFieldValueChangesTo
+from django_lifecycle.model_state import DirtyFieldsModelState
 from django_lifecycle.models import LifecycleModel
 
 
@@ -193,3 +203,175 @@ class ModelThatFailsIfTriggered(LifecycleModel):
     @hook("after_create")
     def one_hook(self):
         raise RuntimeError
+
+
+class Article(LifecycleModel):
+    lifecycle_snapshot_watched_fields_only = True
+
+    title = models.CharField(max_length=100)
+    body = models.TextField(blank=True)
+    status = models.CharField(max_length=30, default="draft")
+    published_at = models.DateTimeField(null=True)
+
+    @hook(BEFORE_UPDATE, condition=WhenFieldValueChangesTo("status", value="published"))
+    def timestamp_published_at(self):
+        self.published_at = timezone.now()
+
+
+class Invoice(LifecycleModel):
+    lifecycle_state_class = DirtyFieldsModelState
+
+    number = models.CharField(max_length=20)
+    amount = models.IntegerField(default=0)
+    customer = models.ForeignKey(Organization, null=True, on_delete=models.SET_NULL)
+    metadata = models.JSONField(default=dict)
+    revision = models.IntegerField(default=0)
+
+    @hook(BEFORE_UPDATE, condition=WhenFieldHasChanged("amount", has_changed=True))
+    def increment_revision(self):
+        self.revision += 1
+
+
+class Product(LifecycleModel):
+    name = models.CharField(max_length=100)
+    sku = models.CharField(max_length=20)
+    price = models.IntegerField(default=0)
+    price_changes = models.IntegerField(default=0)
+
+    objects = LifecycleManager()
+
+    @hook(BEFORE_CREATE)
+    def normalize_sku(self):
+        self.sku = self.sku.upper()
+
+    @hook(AFTER_CREATE, batch=True)
+    def announce_new_products(cls, products):
+        mail.send_mail(
+            "New products",
+            ", ".join(f"{product.pk}: {product.name}" for product in products),
+            "from@example.com",
+            ["to@example.com"],
+        )
+
+    @hook(BEFORE_UPDATE, condition=WhenFieldHasChanged("price", has_changed=True))
+    def count_price_changes(self):
+        self.price_changes += 1
+
+    @hook(
+        AFTER_UPDATE,
+        condition=WhenFieldHasChanged("price", has_changed=True),
+        batch=True,
+        on_commit=True,
+    )
+    def announce_price_changes(cls, products):
+        mail.send_mail(
+            "Price changes",
+            ", ".join(f"{product.name}: {product.price}" for product in products),
+            "from@example.com",
+            ["to@example.com"],
+        )
+
+
+class Beverage(LifecycleModel):
+    lifecycle_lazy_snapshot = True
+
+    name = models.CharField(max_length=100)
+    price = models.IntegerField(default=0)
+    price_changes = models.IntegerField(default=0)
+
+    @hook(BEFORE_UPDATE, condition=WhenFieldHasChanged("price", has_changed=True))
+    def count_price_changes(self):
+        self.price_changes += 1
+
+    @hook(
+        AFTER_UPDATE,
+        condition=WhenFieldHasChanged("price", has_changed=True),
+        on_commit=True,
+    )
+    def announce_price_change(self):
+        mail.send_mail(
+            "Price change",
+            f"{self.name}: {self.price}",
+            "from@example.com",
+            ["to@example.com"],
+        )
+
+
+class Page(LifecycleModel):
+    title = models.CharField(max_length=100)
+
+    @hook(AFTER_SAVE, on_commit=True, dedupe=True)
+    def purge_cache(self):
+        mail.send_mail("Purge", self.title, "from@example.com", ["to@example.com"])
+
+    @hook(AFTER_SAVE, on_commit=True, dedupe=True, batch=True)
+    def reindex(cls, pages):
+        mail.send_mail(
+            "Reindex",
+            ", ".join(page.title for page in pages),
+            "from@example.com",
+            ["to@example.com"],
+        )
+
+
+class Ticket(LifecycleModel):
+    title = models.CharField(max_length=100)
+    status = models.CharField(max_length=30, default="open")
+    resolution = models.CharField(max_length=100, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    @hook(BEFORE_SAVE)
+    async def normalize_title(self):
+        await asyncio.sleep(0)
+        self.title = self.title.strip()
+
+    @hook(AFTER_CREATE)
+    async def notify_watchers(self):
+        self.events.append("notify_watchers started")
+        await asyncio.sleep(0)
+        self.events.append("notify_watchers done")
+
+    @hook(AFTER_CREATE)
+    async def notify_author(self):
+        self.events.append("notify_author started")
+        await asyncio.sleep(0)
+        self.events.append("notify_author done")
+
+    @hook(AFTER_UPDATE, condition=WhenFieldValueChangesTo("status", value="closed"))
+    async def check_resolution(self):
+        if not self.resolution:
+            raise ValueError("Closed tickets need a resolution")
+
+    @hook(AFTER_UPDATE, condition=WhenFieldHasChanged("status"), on_commit=True)
+    async def send_status_mail(self):
+        mail.send_mail("Status", self.status, "from@example.com", ["to@example.com"])
+
+    @hook(AFTER_UPDATE, on_unchanged=True)
+    async def record_update(self):
+        self.events.append("updated")
+
+    @hook(AFTER_CREATE, on_commit=True, background=True)
+    def send_created_mail(self):
+        mail.send_mail("Created", self.title, "from@example.com", ["to@example.com"])
+
+    @hook(AFTER_DELETE)
+    async def send_deleted_mail(self):
+        mail.send_mail("Deleted", self.title, "from@example.com", ["to@example.com"])
+
+
+class Membership(LifecycleModel):
+    account = models.ForeignKey(UserAccount, on_delete=models.CASCADE)
+    role = models.CharField(max_length=30, default="member")
+
+    @hook(AFTER_UPDATE, when="account.username", has_changed=True)
+    def notify_username_change(self):
+        mail.send_mail(
+            "Username changed",
+            self.account.username,
+            "from@example.com",
+            ["to@example.com"],
+        )
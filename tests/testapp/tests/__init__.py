@@ -0,0 +1,7 @@
+class CommittedCreateMixin:
+    """For `TestCase`s whose tests start from committed instances"""
+
+    def create(self, model, **kwargs):
+        # The initial state is reset once the transaction is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            return model.objects.create(**kwargs)
@@ -0,0 +1,128 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+from django.core import mail
+from django.test import TestCase
+
+from django_lifecycle import bypass_hooks_for
+from tests.testapp.models import Page
+from tests.testapp.models import Ticket
+
+
+class AsyncHooksTests(TestCase):
+    def setUp(self):
+        mail.outbox = []
+
+    def create_ticket(self, **kwargs) -> Ticket:
+        ticket = Ticket(**kwargs)
+        async_to_sync(ticket.asave)()
+        return ticket
+
+    def test_asave_awaits_before_hooks(self):
+        self.create_ticket(title="  Printer on fire  ")
+
+        self.assertEqual(Ticket.objects.get().title, "Printer on fire")
+
+    def test_after_hooks_of_same_priority_run_concurrently(self):
+        ticket = self.create_ticket(title="Printer on fire")
+
+        self.assertEqual(
+            ticket.events,
+            [
+                "notify_author started",
+                "notify_watchers started",
+                "notify_author done",
+                "notify_watchers done",
+            ],
+        )
+
+    def test_save_runs_coroutine_hooks(self):
+        ticket = Ticket(title="  Printer on fire  ")
+        ticket.save()
+
+        self.assertEqual(ticket.title, "Printer on fire")
+        self.assertEqual(len(ticket.events), 4)
+
+    def test_failing_hook_rolls_back_save(self):
+        ticket = self.create_ticket(title="Printer on fire")
+        ticket.status = "closed"
+
+        with self.assertRaises(ValueError):
+            async_to_sync(ticket.asave)()
+
+        self.assertEqual(Ticket.objects.get().status, "open")
+
+    def test_concurrent_asaves_dont_share_a_transaction(self):
+        fixed = self.create_ticket(title="Printer on fire")
+        fixed.resolution = "Extinguished"
+        closed = self.create_ticket(title="Paper jam")
+        closed.status = "closed"
+
+        async def save_both():
+            return await asyncio.gather(
+                fixed.asave(), closed.asave(), return_exceptions=True
+            )
+
+        results = async_to_sync(save_both)()
+
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(Ticket.objects.get(pk=fixed.pk).resolution, "Extinguished")
+        self.assertEqual(Ticket.objects.get(pk=closed.pk).status, "open")
+
+    def test_concurrent_queries_are_not_in_the_asave_transaction(self):
+        ticket = self.create_ticket(title="Printer on fire")
+        ticket.status = "closed"
+
+        async def save_and_create():
+            return await asyncio.gather(
+                ticket.asave(),
+                Page.objects.acreate(title="independent"),
+                return_exceptions=True,
+            )
+
+        error, page = async_to_sync(save_and_create)()
+
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(Page.objects.get(pk=page.pk).title, "independent")
+        self.assertEqual(Ticket.objects.get().status, "open")
+
+    def test_on_commit_coroutine_hook(self):
+        # Nothing left pending in the test's transaction
+        ticket = Ticket(title="Printer on fire")
+        ticket.save(skip_hooks=True)
+        ticket.status = "closed"
+        ticket.resolution = "Extinguished"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            async_to_sync(ticket.asave)()
+
+        self.assertEqual(mail.outbox[0].body, "closed")
+        self.assertFalse(ticket.has_changed("status"))
+
+    def test_adelete_awaits_hooks(self):
+        ticket = self.create_ticket(title="Printer on fire")
+        async_to_sync(ticket.adelete)()
+
+        self.assertFalse(Ticket.objects.exists())
+        self.assertEqual(mail.outbox[0].body, "Printer on fire")
+
+    def test_bypass_applies_to_asave(self):
+        ticket = Ticket(title="  Printer on fire  ")
+
+        async def save():
+            with bypass_hooks_for((Ticket,)):
+                await ticket.asave()
+
+        async_to_sync(save)()
+
+        self.assertEqual(Ticket.objects.get().title, "  Printer on fire  ")
+
+    def test_models_without_coroutine_hooks_save_in_one_call(self):
+        page = Page(title="Draft")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            async_to_sync(page.asave)()
+
+        self.assertEqual(mail.outbox[0].subject, "Purge")
+        self.assertFalse(Page._has_async_hooks_for(("after_save",)))
+        self.assertTrue(Ticket._has_async_hooks_for(("after_save", "after_create")))
@@ -0,0 +1,148 @@
+import threading
+
+from django.core import mail
+from django.test import SimpleTestCase
+from django.test import TestCase
+
+from django_lifecycle import AFTER_SAVE
+from django_lifecycle import hook
+from django_lifecycle.background import HookExecutor
+from django_lifecycle.background import SynchronousHookExecutor
+from django_lifecycle.background import ThreadPoolHookExecutor
+from django_lifecycle.background import set_hook_executor
+from django_lifecycle.decorators import DjangoLifeCycleException
+from tests.testapp.models import Ticket
+
+
+class RecordingHookExecutor(HookExecutor):
+    def __init__(self):
+        super().__init__()
+        self.submitted = []
+
+    def submit(self, func, name):
+        self.submitted.append((func, name))
+
+
+class BackgroundHooksTests(TestCase):
+    def use_executor(self, executor):
+        previous = set_hook_executor(executor)
+        self.addCleanup(set_hook_executor, previous)
+
+    def test_hook_is_submitted_once_committed(self):
+        executor = RecordingHookExecutor()
+        self.use_executor(executor)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Ticket.objects.create(title="Printer on fire")
+
+        self.assertEqual(executor.submitted, [])
+
+        for callback in callbacks:
+            callback()
+
+        [(func, name)] = executor.submitted
+        self.assertEqual(name, "send_created_mail_on_commit")
+        self.assertEqual(mail.outbox, [])
+
+        func()
+        self.assertEqual(mail.outbox[0].body, "Printer on fire")
+
+    def test_hook_gets_a_copy_of_the_committed_instance(self):
+        executor = RecordingHookExecutor()
+        self.use_executor(executor)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ticket = Ticket.objects.create(title="Printer on fire")
+
+        # The initial state of the instance was reset once committed
+        self.assertFalse(ticket.has_changed("id"))
+
+        [(func, name)] = executor.submitted
+        [committed] = func.args
+        self.assertIsNot(committed, ticket)
+        self.assertEqual(committed.pk, ticket.pk)
+        self.assertTrue(committed.has_changed("id"))
+        self.assertIsNone(committed.initial_value("id"))
+
+    def test_synchronous_executor(self):
+        self.use_executor(SynchronousHookExecutor())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Ticket.objects.create(title="Printer on fire")
+
+        self.assertEqual(mail.outbox[0].subject, "Created")
+
+    def test_executors_must_implement_submit(self):
+        with self.assertRaises(TypeError):
+            HookExecutor()
+
+    def test_background_requires_on_commit(self):
+        with self.assertRaises(DjangoLifeCycleException):
+            hook(AFTER_SAVE, background=True)
+
+
+class ThreadPoolHookExecutorTests(SimpleTestCase):
+    def setUp(self):
+        self.errors = []
+        self.executor = ThreadPoolHookExecutor(
+            max_workers=1,
+            max_pending=1,
+            on_error=lambda name, error: self.errors.append((name, error)),
+        )
+        self.addCleanup(self.executor.shutdown)
+
+    def test_runs_hooks_in_worker_threads(self):
+        threads = []
+        self.executor.submit(lambda: threads.append(threading.current_thread()), "h")
+
+        self.assertTrue(self.executor.drain(timeout=5))
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_reports_errors(self):
+        error = ValueError("Webhook down")
+
+        def fail():
+            raise error
+
+        self.executor.submit(fail, "notify")
+        self.executor.drain(timeout=5)
+
+        self.assertEqual(self.errors, [("notify", error)])
+
+    def test_submit_waits_for_a_free_slot(self):
+        release = threading.Event()
+        submitted = threading.Event()
+        self.executor.submit(release.wait, "slow")
+
+        def submit():
+            self.executor.submit(lambda: None, "next")
+            submitted.set()
+
+        thread = threading.Thread(target=submit)
+        thread.start()
+
+        self.assertFalse(submitted.wait(timeout=0.1))
+        release.set()
+        thread.join(timeout=5)
+        self.assertTrue(submitted.is_set())
+        self.assertTrue(self.executor.drain(timeout=5))
+
+    def test_hooks_submitted_by_hooks_run_inline(self):
+        calls = []
+
+        def submit_more():
+            self.executor.submit(lambda: calls.append("inner"), "inner")
+            calls.append("outer")
+
+        self.executor.submit(submit_more, "outer")
+
+        self.assertTrue(self.executor.drain(timeout=5))
+        self.assertEqual(calls, ["inner", "outer"])
+
+    def test_runs_inline_once_shut_down(self):
+        calls = []
+        self.executor.submit(lambda: calls.append(1), "first")
+        self.executor.shutdown()
+        self.executor.submit(lambda: calls.append(threading.current_thread()), "h")
+
+        self.assertEqual(calls, [1, threading.current_thread()])
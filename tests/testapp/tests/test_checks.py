@@ -0,0 +1,85 @@
+from django.db import models
+from django.test import SimpleTestCase
+from django.test.utils import isolate_apps
+
+from django_lifecycle import AFTER_SAVE
+from django_lifecycle import LifecycleModel
+from django_lifecycle import hook
+from django_lifecycle_checks.apps import (
+    check_models_with_hooked_methods_inherit_from_lifecycle as check,
+)
+
+
+@hook(AFTER_SAVE)
+def notify(self):
+    pass
+
+
+class HookedMethodsCheckTests(SimpleTestCase):
+    def test_installed_models(self):
+        self.assertEqual(list(check()), [])
+
+    def test_model_with_hooked_methods_without_mixin(self):
+        with isolate_apps("tests.testapp") as apps:
+
+            class Report(models.Model):
+                @hook(AFTER_SAVE)
+                def notify(self):
+                    pass
+
+            class Summary(LifecycleModel):
+                @hook(AFTER_SAVE)
+                def notify(self):
+                    pass
+
+            errors = list(check(apps.get_app_configs()))
+
+        self.assertEqual([error.obj for error in errors], [Report])
+        self.assertEqual(errors[0].id, "django_lifecycle.E001")
+
+    def test_hooked_methods_inherited_from_abstract_model(self):
+        with isolate_apps("tests.testapp") as apps:
+
+            class BaseReport(models.Model):
+                @hook(AFTER_SAVE)
+                def notify(self):
+                    pass
+
+                class Meta:
+                    abstract = True
+
+            class Report(BaseReport):
+                pass
+
+            errors = list(check(apps.get_app_configs()))
+
+        self.assertEqual([error.obj for error in errors], [Report])
+
+    def test_overridden_hooked_methods(self):
+        with isolate_apps("tests.testapp") as apps:
+
+            class BaseReport(models.Model):
+                @hook(AFTER_SAVE)
+                def notify(self):
+                    pass
+
+                class Meta:
+                    abstract = True
+
+            class Report(BaseReport):
+                def notify(self):
+                    pass
+
+            errors = list(check(apps.get_app_configs()))
+
+        self.assertEqual(errors, [])
+
+    def test_hooked_function_defined_outside_the_class(self):
+        with isolate_apps("tests.testapp") as apps:
+
+            class Report(models.Model):
+                on_save = notify
+
+            errors = list(check(apps.get_app_configs()))
+
+        self.assertEqual([error.obj for error in errors], [Report])
@@ -1,12 +1,18 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
 from django.test import TestCase
 
 from django_lifecycle.constants import NotSet
+from django_lifecycle.conditions import Expensive
 from django_lifecycle.conditions import WhenFieldValueChangesTo
 from django_lifecycle.conditions import WhenFieldHasChanged
 from django_lifecycle.conditions import WhenFieldValueIsNot
 from django_lifecycle.conditions import WhenFieldValueIs
 from django_lifecycle.conditions import WhenFieldValueWas
 from django_lifecycle.conditions import WhenFieldValueWasNot
+from django_lifecycle.conditions.legacy import When
+from django_lifecycle.conditions.legacy import WhenAny
 from tests.testapp.models import UserAccount
 
 
@@ -34,6 +40,17 @@ class ChainableConditionsTests(TestCase):
         self.assertTrue(user_has_superpowers(UserAccount(username="superuser")))
         self.assertFalse(user_has_superpowers(UserAccount(username="citizen")))
 
+    def test_chained_condition_watched_field_names(self):
+        condition = WhenFieldValueIs("first_name", value="Homer") & (
+            WhenFieldHasChanged("last_name") | WhenFieldValueWas("username")
+        )
+        self.assertEqual(
+            condition.watched_field_names(), {"first_name", "last_name", "username"}
+        )
+
+        custom = WhenFieldValueIs("first_name", value="Homer") & (lambda *args: True)
+        self.assertIsNone(custom.watched_field_names())
+
 
 class ConditionsTests(TestCase):
     @property
@@ -184,3 +201,76 @@ class ConditionsTests(TestCase):
         user_account = UserAccount.objects.get()
         user_account.last_name = "Bouvier"
         self.assertFalse(condition(user_account))
+
+
+class LegacyConditionsTests(TestCase):
+    def test_when_reads_initial_and_current_values_once(self):
+        condition = When(when="last_name", was="Simpson", changes_to="Flanders")
+        account = UserAccount.objects.create(first_name="Ned", last_name="Simpson")
+        account.last_name = "Flanders"
+
+        with patch.object(
+            UserAccount, "initial_value", autospec=True, return_value="Simpson"
+        ) as initial_value:
+            with patch.object(
+                UserAccount, "_current_value", autospec=True, return_value="Flanders"
+            ) as current_value:
+                self.assertTrue(condition(account))
+
+        initial_value.assert_called_once_with(account, "last_name")
+        current_value.assert_called_once_with(account, "last_name")
+
+    def test_when_skips_wildcard_checks(self):
+        condition = When(when="last_name")
+        account = UserAccount(last_name="Simpson")
+
+        with patch.object(UserAccount, "initial_value") as initial_value:
+            with patch.object(UserAccount, "_current_value") as current_value:
+                self.assertTrue(condition(account))
+
+        initial_value.assert_not_called()
+        current_value.assert_not_called()
+
+    def test_when_respects_update_fields(self):
+        condition = When(when="last_name")
+        account = UserAccount(last_name="Simpson")
+        self.assertFalse(condition(account, update_fields=["first_name"]))
+        self.assertTrue(condition(account, update_fields=["last_name"]))
+
+    def test_when_any_matches_any_field(self):
+        condition = WhenAny(when_any=["first_name", "last_name"], is_now="Homer")
+        self.assertTrue(condition(UserAccount(first_name="Bart", last_name="Homer")))
+        self.assertFalse(condition(UserAccount(first_name="Bart", last_name="Simpson")))
+
+
+class ChainedConditionEvaluationTests(TestCase):
+    def test_and_short_circuits(self):
+        right = MagicMock(return_value=True)
+        condition = WhenFieldValueIs("first_name", value="Homer") & right
+        self.assertFalse(condition(UserAccount(first_name="Ned")))
+        right.assert_not_called()
+
+    def test_or_short_circuits(self):
+        right = MagicMock(return_value=False)
+        condition = WhenFieldValueIs("first_name", value="Homer") | right
+        self.assertTrue(condition(UserAccount(first_name="Homer")))
+        right.assert_not_called()
+
+    def test_chains_of_the_same_operator_are_flattened(self):
+        a, b, c, d = (WhenFieldValueIs("username", value=name) for name in "abcd")
+        condition = a | b | c | d
+        self.assertEqual(condition.conditions, [a, b, c, d])
+        self.assertTrue(condition(UserAccount(username="d")))
+
+        mixed = (a & b) | c
+        self.assertEqual(len(mixed.conditions), 2)
+
+    def test_expensive_conditions_are_evaluated_last(self):
+        expensive = Expensive(MagicMock(return_value=True))
+        dotted = WhenFieldHasChanged("organization.name", has_changed=True)
+        cheap = WhenFieldValueIs("first_name", value="Homer")
+
+        condition = expensive & dotted & cheap
+        self.assertEqual(condition.conditions, [cheap, expensive, dotted])
+        self.assertFalse(condition(UserAccount(first_name="Ned")))
+        expensive.condition.assert_not_called()
@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from django_lifecycle.decorators import UnloadedFieldError
+from tests.testapp.models import Article
+from tests.testapp.models import Invoice
+from tests.testapp.models import Organization
+from tests.testapp.models import Product
+from tests.testapp.models import UserAccount
+
+
+class DeferredFieldsTests(TestCase):
+    def setUp(self):
+        org = Organization.objects.create(name="Springfield Elementary")
+        UserAccount.objects.create(
+            username="bart", email="bart@example.com", organization=org
+        )
+
+    def test_snapshot_does_not_load_deferred_fields(self):
+        # Even the organization watched with "organization.name" isn't loaded
+        with self.assertNumQueries(1):
+            account = UserAccount.objects.only("username").get()
+
+        self.assertIn("email", account.get_deferred_fields())
+
+    def test_unloaded_field_has_not_changed(self):
+        account = UserAccount.objects.only("username").get()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(account.has_changed("email"))
+            self.assertFalse(account.has_changed("organization.name"))
+
+    def test_initial_value_loads_field_once(self):
+        account = UserAccount.objects.only("username").get()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(account.initial_value("email"), "bart@example.com")
+            self.assertEqual(account.email, "bart@example.com")
+
+    def test_field_assigned_before_being_loaded(self):
+        account = UserAccount.objects.only("username").get()
+        account.email = "el.barto@example.com"
+
+        self.assertTrue(account.has_changed("email"))
+        self.assertEqual(account.initial_value("email"), "bart@example.com")
+
+    def test_loading_a_deferred_field_keeps_other_changes(self):
+        account = UserAccount.objects.only("username").get()
+        account.username = "el barto"
+
+        self.assertEqual(account.email, "bart@example.com")
+        self.assertTrue(account.has_changed("username"))
+        self.assertFalse(account.has_changed("email"))
+
+    def test_condition_loads_deferred_field_on_save(self):
+        Article.objects.create(title="Draft")
+        article = Article.objects.only("title").get()
+        article.title = "Final"
+        article.save()
+
+        article.refresh_from_db()
+        self.assertEqual(article.title, "Final")
+        self.assertIsNone(article.published_at)
+
+    def test_condition_raises_if_deferred_fields_must_not_be_loaded(self):
+        Article.objects.create(title="Draft")
+        article = Article.objects.only("title").get()
+        article.title = "Final"
+
+        with patch.object(Article, "lifecycle_deferred_fields", "raise"):
+            with self.assertRaises(UnloadedFieldError), self.assertNumQueries(0):
+                article.initial_value("status")
+
+            # Fields that were never loaded nor assigned haven't changed
+            self.assertFalse(article.has_changed("status"))
+
+    def test_bulk_update_writes_fields_assigned_before_being_loaded(self):
+        Product.objects.create(name="Duff", sku="duff", price=5)
+        product = Product.objects.only("name").get()
+        product.price = 6
+
+        Product.objects.bulk_update([product])
+
+        product = Product.objects.get()
+        self.assertEqual(product.price, 6)
+        self.assertEqual(product.price_changes, 1)
+
+
+class DeferredFieldsDirtyFieldsModelStateTests(TestCase):
+    def setUp(self):
+        Invoice.objects.create(number="INV-1", amount=10)
+
+    def test_field_assigned_before_being_loaded(self):
+        invoice = Invoice.objects.only("number").get()
+        invoice.amount = 20
+
+        self.assertTrue(invoice.has_changed("amount"))
+        self.assertEqual(invoice.initial_value("amount"), 10)
+
+    def test_loading_a_deferred_field_keeps_other_changes(self):
+        invoice = Invoice.objects.only("number").get()
+        invoice.number = "INV-2"
+
+        self.assertEqual(invoice.amount, 10)
+        self.assertTrue(invoice.has_changed("number"))
+        self.assertFalse(invoice.has_changed("amount"))
+
+    def test_initial_value_loads_field(self):
+        invoice = Invoice.objects.only("number").get()
+        self.assertEqual(invoice.initial_value("amount"), 10)
+        self.assertNotIn("amount", invoice.get_deferred_fields())
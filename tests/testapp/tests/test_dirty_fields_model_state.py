@@ -0,0 +1,73 @@
+from django.test import TestCase
+
+from django_lifecycle.mixins import DirtyFieldDescriptor
+from tests.testapp.models import Invoice
+from tests.testapp.models import Organization
+
+
+class DirtyFieldsModelStateTests(TestCase):
+    def test_descriptors_are_installed_on_concrete_fields(self):
+        self.assertIsInstance(Invoice.__dict__["amount"], DirtyFieldDescriptor)
+        self.assertIsInstance(Invoice.__dict__["customer_id"], DirtyFieldDescriptor)
+        # Class access still returns Django's descriptor
+        self.assertEqual(Invoice.amount.field.name, "amount")
+
+    def test_has_changed_after_assignment(self):
+        Invoice.objects.create(number="INV-1", amount=10)
+        invoice = Invoice.objects.get()
+
+        self.assertFalse(invoice.has_changed("amount"))
+        self.assertEqual(invoice._initial_state.original_values, {})
+
+        invoice.amount = 20
+        invoice.amount = 30
+        self.assertTrue(invoice.has_changed("amount"))
+        self.assertEqual(invoice.initial_value("amount"), 10)
+        self.assertEqual(invoice._diff_with_initial, {"amount": (10, 30)})
+
+    def test_assigning_the_initial_value_back_is_not_a_change(self):
+        invoice = Invoice.objects.create(number="INV-1", amount=10)
+        invoice = Invoice.objects.get(pk=invoice.pk)
+        invoice.amount = 20
+        invoice.amount = 10
+        self.assertFalse(invoice.has_changed("amount"))
+
+    def test_fk_assignment_is_tracked(self):
+        acme = Organization.objects.create(name="Acme")
+        globex = Organization.objects.create(name="Globex")
+        Invoice.objects.create(number="INV-1", customer=acme)
+        invoice = Invoice.objects.get()
+
+        invoice.customer = globex
+        self.assertTrue(invoice.has_changed("customer"))
+        self.assertEqual(invoice.initial_value("customer"), acme.pk)
+
+    def test_in_place_mutation_of_mutable_value_is_detected(self):
+        Invoice.objects.create(number="INV-1", metadata={"paid": False})
+        invoice = Invoice.objects.get()
+
+        invoice.metadata["paid"] = True
+        self.assertTrue(invoice.has_changed("metadata"))
+        self.assertEqual(invoice.initial_value("metadata"), {"paid": False})
+
+    def test_hooks_fire_and_state_resets_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invoice = Invoice.objects.create(number="INV-1", amount=10)
+        invoice = Invoice.objects.get(pk=invoice.pk)
+        invoice.amount = 20
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invoice.save()
+
+        self.assertEqual(invoice.revision, 1)
+        self.assertFalse(invoice.has_changed("amount"))
+        self.assertEqual(invoice.initial_value("amount"), 20)
+
+    def test_refresh_from_db_resets_state(self):
+        invoice = Invoice.objects.create(number="INV-1", amount=10)
+        invoice = Invoice.objects.get(pk=invoice.pk)
+        Invoice.objects.update(amount=50)
+
+        invoice.refresh_from_db()
+        self.assertFalse(invoice.has_changed("amount"))
+        self.assertEqual(invoice.initial_value("amount"), 50)
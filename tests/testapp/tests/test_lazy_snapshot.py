@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import TestCase
+
+from django_lifecycle import LifecycleModelMixin
+from django_lifecycle.mixins import LazyInitialStateDescriptor
+from tests.testapp.models import Beverage
+from tests.testapp.models import Organization
+from tests.testapp.models import UserAccount
+
+
+class LazySnapshotTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Beverage.objects.create(name="Duff", price=5)
+        mail.outbox = []
+
+    def test_instances_loaded_from_db_are_not_snapshotted(self):
+        beverage = Beverage.objects.get()
+
+        self.assertNotIn("_initial_state", beverage.__dict__)
+        self.assertIn("_lazy_snapshot", beverage.__dict__)
+
+    def test_instances_created_in_python_are_snapshotted(self):
+        beverage = Beverage(name="Buzz Cola")
+        self.assertIn("_initial_state", beverage.__dict__)
+
+    def test_snapshot_is_built_from_loaded_values(self):
+        beverage = Beverage.objects.get()
+        beverage.price = 6
+
+        self.assertTrue(beverage.has_changed("price"))
+        self.assertEqual(beverage.initial_value("price"), 5)
+        self.assertNotIn("_lazy_snapshot", beverage.__dict__)
+
+    def test_hooks_see_changes_made_before_the_snapshot(self):
+        beverage = Beverage.objects.get()
+        beverage.price = 6
+
+        with self.captureOnCommitCallbacks(execute=True):
+            beverage.save()
+
+        self.assertEqual(beverage.price_changes, 1)
+        self.assertEqual(mail.outbox[0].body, "Duff: 6")
+        self.assertFalse(beverage.has_changed("price"))
+
+    def test_deferred_fields_stay_unknown(self):
+        beverage = Beverage.objects.only("name").get()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(beverage.has_changed("price"))
+
+        self.assertEqual(beverage.initial_value("price"), 5)
+
+    def test_refresh_from_db_drops_loaded_values(self):
+        beverage = Beverage.objects.get()
+        Beverage.objects.update(price=7)
+        beverage.refresh_from_db()
+
+        self.assertNotIn("_lazy_snapshot", beverage.__dict__)
+        self.assertEqual(beverage.initial_value("price"), 7)
+
+    def test_missing_attributes_still_raise(self):
+        beverage = Beverage.objects.get()
+
+        with self.assertRaises(AttributeError):
+            beverage.does_not_exist
+
+    def test_only_lazy_models_look_up_initial_states(self):
+        self.assertIsInstance(
+            Beverage.__dict__["_initial_state"], LazyInitialStateDescriptor
+        )
+        self.assertFalse(hasattr(LifecycleModelMixin, "__getattr__"))
+        self.assertNotIn("_initial_state", Organization.__dict__)
+
+    def test_disabled_for_models_watching_related_fields(self):
+        UserAccount.objects.create(username="bart")
+        self.addCleanup(UserAccount._snapshots_lazily.cache_clear)
+        UserAccount._snapshots_lazily.cache_clear()
+
+        with patch.object(UserAccount, "lifecycle_lazy_snapshot", True):
+            account = UserAccount.objects.get()
+
+        self.assertIn("_initial_state", account.__dict__)
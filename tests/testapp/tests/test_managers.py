@@ -0,0 +1,225 @@
+from django.core import mail
+from django.db import transaction
+from django.test import TestCase
+
+from django_lifecycle import LifecycleQuerySet
+from django_lifecycle import bypass_hooks_for
+from tests.testapp.models import Membership
+from tests.testapp.models import Organization
+from tests.testapp.models import Product
+from tests.testapp.models import UserAccount
+
+
+class BulkCreateTests(TestCase):
+    def test_before_hooks_run_for_every_instance(self):
+        Product.objects.bulk_create(
+            [Product(name="Duff", sku="duff-1"), Product(name="Buzz", sku="buzz-1")]
+        )
+        self.assertEqual(
+            sorted(Product.objects.values_list("sku", flat=True)),
+            ["BUZZ-1", "DUFF-1"],
+        )
+
+    def test_batch_hook_runs_once_with_all_instances(self):
+        products = Product.objects.bulk_create(
+            [Product(name="Duff", sku="duff-1"), Product(name="Buzz", sku="buzz-1")]
+        )
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(
+            mail.outbox[0].body,
+            f"{products[0].pk}: Duff, {products[1].pk}: Buzz",
+        )
+
+    def test_inserts_in_a_single_query(self):
+        with self.assertNumQueries(1):
+            Product.objects.bulk_create(
+                [Product(name=f"Product {i}", sku=f"p-{i}") for i in range(10)]
+            )
+
+    def test_initial_state_is_reset_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            (product,) = Product.objects.bulk_create([Product(name="Duff", sku="d")])
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(product.has_changed("sku"))
+        self.assertFalse(product.has_changed("id"))
+
+    def test_after_hooks_dont_fire_when_conflicts_are_ignored(self):
+        existing = Product.objects.create(name="Duff", sku="d")
+        mail.outbox = []
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            (product,) = Product.objects.bulk_create(
+                [Product(pk=existing.pk, name="dup", sku="x")], ignore_conflicts=True
+            )
+
+        self.assertEqual(product.sku, "X")
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(callbacks, [])
+        self.assertEqual(Product.objects.get().name, "Duff")
+
+    def test_skip_hooks(self):
+        Product.objects.bulk_create([Product(name="Duff", sku="d")], skip_hooks=True)
+        self.assertEqual(Product.objects.get().sku, "d")
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_bypass_hooks_for(self):
+        with bypass_hooks_for((Product,)):
+            Product.objects.bulk_create([Product(name="Duff", sku="d")])
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_batch_hook_runs_with_single_instance_on_save(self):
+        product = Product.objects.create(name="Duff", sku="d")
+        self.assertEqual(mail.outbox[0].body, f"{product.pk}: Duff")
+
+
+class BulkUpdateTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.bulk_create(
+                [
+                    Product(name="Duff", sku="d", price=3),
+                    Product(name="Buzz", sku="b", price=2),
+                    Product(name="Squishee", sku="s", price=1),
+                ]
+            )
+        mail.outbox = []
+
+    def test_writes_the_union_of_changed_fields_in_one_query(self):
+        duff, buzz, squishee = Product.objects.order_by("pk")
+        duff.price = 4
+        buzz.price = 5
+        squishee.name = "Squishee XL"
+
+        with self.assertNumQueries(1) as queries:
+            rows = Product.objects.bulk_update([duff, buzz, squishee])
+
+        self.assertEqual(rows, 3)
+        update_sql = queries.captured_queries[0]["sql"]
+        self.assertIn('"price"', update_sql)
+        self.assertIn('"name"', update_sql)
+        self.assertNotIn('"sku"', update_sql)
+        self.assertEqual(
+            list(Product.objects.order_by("pk").values_list("name", "price")),
+            [("Duff", 4), ("Buzz", 5), ("Squishee XL", 1)],
+        )
+
+    def test_hooks_fire_per_instance_and_batch(self):
+        duff, buzz, squishee = Product.objects.order_by("pk")
+        duff.price = 4
+        buzz.price = 5
+        squishee.name = "Squishee XL"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.bulk_update([duff, buzz, squishee])
+
+        self.assertEqual(
+            list(
+                Product.objects.order_by("pk").values_list("price_changes", flat=True)
+            ),
+            [1, 1, 0],
+        )
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].body, "Duff: 4, Buzz: 5")
+        self.assertFalse(duff.has_changed("price"))
+
+    def test_explicit_fields_are_passed_to_conditions(self):
+        duff = Product.objects.get(name="Duff")
+        duff.price = 4
+        duff.name = "Duff Lite"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.bulk_update([duff], ["name"])
+
+        duff.refresh_from_db()
+        self.assertEqual(
+            (duff.name, duff.price, duff.price_changes), ("Duff Lite", 3, 0)
+        )
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_reverted_changes_are_written(self):
+        duff = Product.objects.get(name="Duff")
+
+        with transaction.atomic():
+            duff.price = 4
+            Product.objects.bulk_update([duff])
+            duff.price = 3
+            Product.objects.bulk_update([duff])
+
+        self.assertEqual(Product.objects.get(name="Duff").price, 3)
+
+    def test_changed_fields_are_written_when_hooks_are_skipped(self):
+        duff, buzz, squishee = Product.objects.order_by("pk")
+        duff.price = 4
+        squishee.name = "Squishee XL"
+
+        with self.assertNumQueries(1) as queries:
+            Product.objects.bulk_update([duff, buzz, squishee], skip_hooks=True)
+
+        with bypass_hooks_for((Product,)):
+            self.assertEqual(Product.objects.bulk_update([duff, buzz, squishee]), 0)
+
+        self.assertNotIn('"sku"', queries.captured_queries[0]["sql"])
+        self.assertEqual(
+            list(Product.objects.order_by("pk").values_list("name", "price")),
+            [("Duff", 4), ("Buzz", 2), ("Squishee XL", 1)],
+        )
+        self.assertEqual(Product.objects.get(name="Duff").price_changes, 0)
+
+    def test_nothing_changed_skips_the_write(self):
+        with self.assertNumQueries(1):
+            products = list(Product.objects.all())
+        with self.assertNumQueries(0):
+            self.assertEqual(Product.objects.bulk_update(products), 0)
+
+
+class WatchedRelatedFieldsPrefetchTests(TestCase):
+    def setUp(self):
+        for name in ("Dunder Mifflin", "Vance Refrigeration", "Sabre"):
+            UserAccount.objects.create(
+                username=name,
+                organization=Organization.objects.create(name=name),
+            )
+
+    def test_prefetch_paths(self):
+        self.assertEqual(UserAccount._watched_fk_prefetch_paths(), ["organization"])
+
+    def test_loading_instances_costs_a_constant_number_of_queries(self):
+        with self.assertNumQueries(2):
+            accounts = list(LifecycleQuerySet(UserAccount).order_by("pk"))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [account.initial_value("organization.name") for account in accounts],
+                ["Dunder Mifflin", "Vance Refrigeration", "Sabre"],
+            )
+            self.assertFalse(accounts[0].has_changed("organization.name"))
+
+    def test_iterator_prefetches_per_chunk(self):
+        # One SELECT for the accounts, one per chunk for the organizations
+        with self.assertNumQueries(3):
+            accounts = list(LifecycleQuerySet(UserAccount).iterator(chunk_size=2))
+
+        self.assertEqual(accounts[2].initial_value("organization.name"), "Sabre")
+
+    def test_snapshot_is_not_deferred_outside_the_queryset(self):
+        accounts = LifecycleQuerySet(UserAccount).iterator(chunk_size=1)
+        next(accounts)
+        account = UserAccount.objects.first()
+        self.assertEqual(account.initial_value("organization.name"), "Dunder Mifflin")
+
+    def test_instances_of_other_models_are_snapshotted(self):
+        for account in UserAccount.objects.all():
+            Membership.objects.create(account=account)
+
+        memberships = list(
+            LifecycleQuerySet(Membership).select_related("account").order_by("pk")
+        )
+
+        self.assertEqual(
+            memberships[0].initial_value("account.username"), "Dunder Mifflin"
+        )
+        self.assertEqual(
+            memberships[0].account.initial_value("organization.name"), "Dunder Mifflin"
+        )
@@ -1,12 +1,30 @@
+import asyncio
+import threading
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
+from asgiref.sync import async_to_sync
+from django.core import mail
+from django.db import connection
+from django.db.models.signals import post_save
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.test.utils import isolate_apps
 
+from django_lifecycle import AFTER_SAVE
+from django_lifecycle import LifecycleModel
 from django_lifecycle import bypass_hooks_for
+from django_lifecycle import hook
+from django_lifecycle import warm_up
 from django_lifecycle.constants import NotSet
 from django_lifecycle.decorators import HookConfig
+from django_lifecycle.hooks import DELETE_HOOKS
+from django_lifecycle.hooks import SAVE_HOOKS
+from django_lifecycle.mixins import _bypass_state
+from django_lifecycle.mixins import build_hook_dispatch_table
 from django_lifecycle.priority import DEFAULT_PRIORITY
 from tests.testapp.models import CannotRename
+from tests.testapp.models import Locale
 from tests.testapp.models import ModelThatFailsIfTriggered
 from tests.testapp.models import Organization
 from tests.testapp.models import UserAccount
@@ -103,43 +121,45 @@ class LifecycleMixinTests(TestCase):
     def test_run_hooked_methods_for_when(self):
         instance = UserAccount(first_name="Bob")
 
-        instance._potentially_hooked_methods = MagicMock(
-            return_value=[
-                MagicMock(
-                    __name__="method_that_does_fires",
-                    _hooked=[
-                        HookConfig(
-                            hook="after_create",
-                            when="first_name",
-                            when_any=None,
-                            has_changed=None,
-                            is_now="Bob",
-                            is_not=NotSet,
-                            was="*",
-                            was_not=NotSet,
-                            changes_to=NotSet,
-                            priority=DEFAULT_PRIORITY,
-                        )
-                    ],
-                ),
-                MagicMock(
-                    __name__="method_that_does_not_fire",
-                    _hooked=[
-                        HookConfig(
-                            hook="after_create",
-                            when="first_name",
-                            when_any=None,
-                            has_changed=None,
-                            is_now="Bill",
-                            is_not=NotSet,
-                            was="*",
-                            was_not=NotSet,
-                            changes_to=NotSet,
-                            priority=DEFAULT_PRIORITY,
-                        )
-                    ],
-                ),
-            ]
+        instance._hook_dispatch_table = MagicMock(
+            return_value=build_hook_dispatch_table(
+                [
+                    MagicMock(
+                        __name__="method_that_does_fires",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_create",
+                                when="first_name",
+                                when_any=None,
+                                has_changed=None,
+                                is_now="Bob",
+                                is_not=NotSet,
+                                was="*",
+                                was_not=NotSet,
+                                changes_to=NotSet,
+                                priority=DEFAULT_PRIORITY,
+                            )
+                        ],
+                    ),
+                    MagicMock(
+                        __name__="method_that_does_not_fire",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_create",
+                                when="first_name",
+                                when_any=None,
+                                has_changed=None,
+                                is_now="Bill",
+                                is_not=NotSet,
+                                was="*",
+                                was_not=NotSet,
+                                changes_to=NotSet,
+                                priority=DEFAULT_PRIORITY,
+                            )
+                        ],
+                    ),
+                ]
+            )
         )
         fired_methods = instance._run_hooked_methods("after_create")
         self.assertEqual(fired_methods, ["method_that_does_fires"])
@@ -147,43 +167,45 @@ class LifecycleMixinTests(TestCase):
     def test_run_hooked_methods_for_when_any(self):
         instance = UserAccount(first_name="Bob")
 
-        instance._potentially_hooked_methods = MagicMock(
-            return_value=[
-                MagicMock(
-                    __name__="method_that_does_fires",
-                    _hooked=[
-                        HookConfig(
-                            hook="after_create",
-                            when=None,
-                            when_any=["first_name", "last_name", "password"],
-                            has_changed=None,
-                            is_now="Bob",
-                            is_not=NotSet,
-                            was="*",
-                            was_not=NotSet,
-                            changes_to=NotSet,
-                            priority=DEFAULT_PRIORITY,
-                        )
-                    ],
-                ),
-                MagicMock(
-                    __name__="method_that_does_not_fire",
-                    _hooked=[
-                        HookConfig(
-                            hook="after_create",
-                            when="first_name",
-                            when_any=None,
-                            has_changed=None,
-                            is_now="Bill",
-                            is_not=NotSet,
-                            was="*",
-                            was_not=NotSet,
-                            changes_to=NotSet,
-                            priority=DEFAULT_PRIORITY,
-                        )
-                    ],
-                ),
-            ]
+        instance._hook_dispatch_table = MagicMock(
+            return_value=build_hook_dispatch_table(
+                [
+                    MagicMock(
+                        __name__="method_that_does_fires",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_create",
+                                when=None,
+                                when_any=["first_name", "last_name", "password"],
+                                has_changed=None,
+                                is_now="Bob",
+                                is_not=NotSet,
+                                was="*",
+                                was_not=NotSet,
+                                changes_to=NotSet,
+                                priority=DEFAULT_PRIORITY,
+                            )
+                        ],
+                    ),
+                    MagicMock(
+                        __name__="method_that_does_not_fire",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_create",
+                                when="first_name",
+                                when_any=None,
+                                has_changed=None,
+                                is_now="Bill",
+                                is_not=NotSet,
+                                was="*",
+                                was_not=NotSet,
+                                changes_to=NotSet,
+                                priority=DEFAULT_PRIORITY,
+                            )
+                        ],
+                    ),
+                ]
+            )
         )
         fired_methods = instance._run_hooked_methods("after_create")
         self.assertEqual(fired_methods, ["method_that_does_fires"])
@@ -395,7 +417,8 @@ class LifecycleMixinTests(TestCase):
         data = self.stub_data
         data["first_name"] = "Marge"
         data["last_name"] = "Simpson"
-        account = UserAccount.objects.create(**data)
+        with self.captureOnCommitCallbacks(execute=True):
+            account = UserAccount.objects.create(**data)
         account.first_name = "Maggie"
         self.assertTrue(account.has_changed("first_name"))
         with self.captureOnCommitCallbacks(execute=True) as callbacks:
@@ -410,87 +433,91 @@ class LifecycleMixinTests(TestCase):
     def test_run_hooked_methods_for_on_commit(self):
         instance = UserAccount(first_name="Bob")
 
-        instance._potentially_hooked_methods = MagicMock(
-            return_value=[
-                MagicMock(
-                    __name__="method_that_fires_on_commit",
-                    _hooked=[
-                        HookConfig(
-                            hook="after_create",
-                            when=None,
-                            when_any=None,
-                            has_changed=None,
-                            is_now="*",
-                            is_not=NotSet,
-                            was="*",
-                            was_not=NotSet,
-                            changes_to=NotSet,
-                            on_commit=True,
-                            priority=DEFAULT_PRIORITY,
-                        )
-                    ],
-                ),
-                MagicMock(
-                    __name__="method_that_fires_in_transaction",
-                    _hooked=[
-                        HookConfig(
-                            hook="after_create",
-                            when=None,
-                            when_any=None,
-                            has_changed=None,
-                            is_now="*",
-                            is_not=NotSet,
-                            was="*",
-                            was_not=NotSet,
-                            changes_to=NotSet,
-                            on_commit=False,
-                            priority=DEFAULT_PRIORITY,
-                        )
-                    ],
-                ),
-                MagicMock(
-                    __name__="method_that_fires_in_default",
-                    _hooked=[
-                        HookConfig(
-                            hook="after_create",
-                            when=None,
-                            when_any=None,
-                            has_changed=None,
-                            is_now="*",
-                            is_not=NotSet,
-                            was="*",
-                            was_not=NotSet,
-                            changes_to=NotSet,
-                            on_commit=None,
-                            priority=DEFAULT_PRIORITY,
-                        )
-                    ],
-                ),
-                MagicMock(
-                    __name__="after_save_method_that_fires_on_commit",
-                    _hooked=[
-                        HookConfig(
-                            hook="after_save",
-                            when=None,
-                            when_any=None,
-                            has_changed=None,
-                            is_now="*",
-                            is_not=NotSet,
-                            was="*",
-                            was_not=NotSet,
-                            changes_to=NotSet,
-                            on_commit=True,
-                            priority=DEFAULT_PRIORITY,
-                        )
-                    ],
-                ),
-                MagicMock(
-                    __name__="after_save_method_that_fires_if_changed_on_commit",
-                    _hooked=[
-                        HookConfig(hook="after_save", has_changed=True, on_commit=True)
-                    ],
-                ),
-            ]
+        instance._hook_dispatch_table = MagicMock(
+            return_value=build_hook_dispatch_table(
+                [
+                    MagicMock(
+                        __name__="method_that_fires_on_commit",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_create",
+                                when=None,
+                                when_any=None,
+                                has_changed=None,
+                                is_now="*",
+                                is_not=NotSet,
+                                was="*",
+                                was_not=NotSet,
+                                changes_to=NotSet,
+                                on_commit=True,
+                                priority=DEFAULT_PRIORITY,
+                            )
+                        ],
+                    ),
+                    MagicMock(
+                        __name__="method_that_fires_in_transaction",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_create",
+                                when=None,
+                                when_any=None,
+                                has_changed=None,
+                                is_now="*",
+                                is_not=NotSet,
+                                was="*",
+                                was_not=NotSet,
+                                changes_to=NotSet,
+                                on_commit=False,
+                                priority=DEFAULT_PRIORITY,
+                            )
+                        ],
+                    ),
+                    MagicMock(
+                        __name__="method_that_fires_in_default",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_create",
+                                when=None,
+                                when_any=None,
+                                has_changed=None,
+                                is_now="*",
+                                is_not=NotSet,
+                                was="*",
+                                was_not=NotSet,
+                                changes_to=NotSet,
+                                on_commit=None,
+                                priority=DEFAULT_PRIORITY,
+                            )
+                        ],
+                    ),
+                    MagicMock(
+                        __name__="after_save_method_that_fires_on_commit",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_save",
+                                when=None,
+                                when_any=None,
+                                has_changed=None,
+                                is_now="*",
+                                is_not=NotSet,
+                                was="*",
+                                was_not=NotSet,
+                                changes_to=NotSet,
+                                on_commit=True,
+                                priority=DEFAULT_PRIORITY,
+                            )
+                        ],
+                    ),
+                    MagicMock(
+                        __name__="after_save_method_that_fires_if_changed_on_commit",
+                        _hooked=[
+                            HookConfig(
+                                hook="after_save", has_changed=True, on_commit=True
+                            )
+                        ],
+                    ),
+                ]
+            )
         )
 
         fired_methods = instance._run_hooked_methods("after_create")
@@ -515,3 +542,224 @@ class LifecycleMixinTests(TestCase):
     def test_bypass_hook_for(self):
         with bypass_hooks_for((ModelThatFailsIfTriggered,)):
             ModelThatFailsIfTriggered.objects.create()
+
+    def test_bypass_hook_for_nested(self):
+        with bypass_hooks_for((ModelThatFailsIfTriggered,)):
+            with bypass_hooks_for((ModelThatFailsIfTriggered, Organization)):
+                pass
+
+            # The outer bypass still applies
+            ModelThatFailsIfTriggered.objects.create()
+
+        with self.assertRaises(RuntimeError):
+            ModelThatFailsIfTriggered.objects.create()
+
+    def test_bypass_hook_for_delete(self):
+        account = UserAccount.objects.create(**self.stub_data)
+        mail.outbox = []
+
+        with bypass_hooks_for((UserAccount,)):
+            account.delete()
+
+        self.assertEqual(mail.outbox, [])
+
+    def test_bypass_hook_for_is_not_shared_with_other_threads(self):
+        bypassed = []
+
+        def check():
+            bypassed.append(_bypass_state.is_bypassed_for(ModelThatFailsIfTriggered))
+
+        with bypass_hooks_for((ModelThatFailsIfTriggered,)):
+            thread = threading.Thread(target=check)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(bypassed, [False])
+
+    def test_bypass_hook_for_is_not_shared_with_other_tasks(self):
+        bypassed = []
+
+        async def check(bypass):
+            if bypass:
+                with bypass_hooks_for((ModelThatFailsIfTriggered,)):
+                    await asyncio.sleep(0)
+                    bypassed.append(
+                        _bypass_state.is_bypassed_for(ModelThatFailsIfTriggered)
+                    )
+            else:
+                await asyncio.sleep(0)
+                bypassed.append(
+                    _bypass_state.is_bypassed_for(ModelThatFailsIfTriggered)
+                )
+
+        async def main():
+            await asyncio.gather(check(True), check(False))
+
+        async_to_sync(main)()
+        self.assertEqual(bypassed, [True, False])
+
+    def test_hook_dispatch_table_is_built_once_per_class(self):
+        table = UserAccount._hook_dispatch_table()
+        self.assertIs(table, UserAccount._hook_dispatch_table())
+        self.assertEqual(
+            [hooked_method.name for _, hooked_method in table["before_update"]],
+            [
+                "count_name_changes",
+                "count_name_changes",
+                "ensure_last_name_is_not_changed_to_flanders",
+                "timestamp_password_change",
+            ],
+        )
+
+    def test_method_hooked_twice_for_same_hook_fires_once(self):
+        account = UserAccount.objects.create(**self.stub_data)
+        account.first_name = "Homer Jay"
+        account.last_name = "Simpsons"
+        account.save()
+        self.assertEqual(account.name_changes, 1)
+
+
+class WatchedFKCacheTests(TestCase):
+    def setUp(self):
+        self.org = Organization.objects.create(name="Dunder Mifflin")
+        UserAccount.objects.create(username="michael", organization=self.org)
+        self.account = UserAccount.objects.get()
+
+    def organization_queries(self, queries):
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "testapp_organization"')
+        ]
+
+    def test_cached_related_object_is_kept_when_nothing_changed(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.account.save()
+            self.account.save()
+
+        self.assertEqual(self.organization_queries(queries), [])
+
+    def test_cached_related_object_is_refreshed_after_related_model_save(self):
+        self.org.name = "Michael Scott Paper Company"
+        self.org.save()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.account.save()
+            self.account.save()
+
+        self.assertEqual(len(self.organization_queries(queries)), 1)
+        self.assertTrue(self.account.has_changed("organization.name"))
+
+    def test_only_related_models_are_listened_to(self):
+        UserAccount._warm_up()
+
+        self.assertTrue(post_save.has_listeners(Organization))
+        self.assertFalse(post_save.has_listeners(Locale))
+
+    def test_cached_related_object_is_cleared_when_fk_changes(self):
+        other = Organization.objects.create(name="Sabre")
+        self.account.organization_id = other.pk
+        self.account.save()
+        self.assertEqual(self.account.organization.name, "Sabre")
+
+    def test_always_refresh_watched_fk(self):
+        with patch.object(UserAccount, "lifecycle_always_refresh_watched_fk", True):
+            with CaptureQueriesContext(connection) as queries:
+                self.account.save()
+
+        self.assertEqual(len(self.organization_queries(queries)), 1)
+
+
+class NoHooksFastPathTests(TestCase):
+    def savepoints(self, queries):
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SAVEPOINT")
+        ]
+
+    def test_save_skips_transaction_without_save_hooks(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            org = Organization.objects.create(name="Dunder Mifflin")
+        org.name = "Sabre"
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                org.save()
+
+        self.assertEqual(self.savepoints(queries), [])
+        self.assertFalse(org.has_changed("name"))
+
+    def test_save_uses_transaction_with_save_hooks(self):
+        account = UserAccount.objects.create(username="michael")
+
+        with CaptureQueriesContext(connection) as queries:
+            account.save()
+
+        self.assertEqual(len(self.savepoints(queries)), 1)
+
+    def test_delete_skips_transaction_without_delete_hooks(self):
+        org = Organization.objects.create(name="Dunder Mifflin")
+
+        with CaptureQueriesContext(connection) as queries:
+            org.delete()
+
+        self.assertEqual(self.savepoints(queries), [])
+        self.assertFalse(Organization.objects.exists())
+
+    def test_has_hooks_for(self):
+        self.assertFalse(Organization._has_hooks_for(SAVE_HOOKS))
+        self.assertTrue(UserAccount._has_hooks_for(SAVE_HOOKS))
+        self.assertTrue(UserAccount._has_hooks_for(DELETE_HOOKS))
+
+
+class HookDiscoveryTests(TestCase):
+    @isolate_apps("tests.testapp")
+    def test_hooks_are_discovered_when_the_class_is_created(self):
+        cache_info = LifecycleModel._hook_dispatch_table.cache_info
+
+        class Report(LifecycleModel):
+            @hook(AFTER_SAVE)
+            def notify(self):
+                pass
+
+        hits = cache_info().hits
+        self.assertEqual(list(Report._hook_dispatch_table()), ["after_save"])
+        self.assertEqual(cache_info().hits, hits + 1)
+
+    def test_per_class_caches_are_unbounded(self):
+        for name in dir(LifecycleModel):
+            cache_info = getattr(getattr(LifecycleModel, name), "cache_info", None)
+            if cache_info is not None:
+                self.assertIsNone(cache_info().maxsize, name)
+
+    @isolate_apps("tests.testapp")
+    def test_overridden_hooked_methods_are_not_discovered(self):
+        class BaseReport(LifecycleModel):
+            @hook(AFTER_SAVE)
+            def notify(self):
+                pass
+
+            @hook(AFTER_SAVE)
+            def archive(self):
+                pass
+
+            class Meta:
+                abstract = True
+
+        class Report(BaseReport):
+            def notify(self):
+                pass
+
+        self.assertEqual(
+            [method.__name__ for method in Report._potentially_hooked_methods()],
+            ["archive"],
+        )
+
+    def test_warm_up_fills_per_class_caches(self):
+        cache_info = LifecycleModel._snapshot_layout.cache_info
+        warm_up()
+
+        hits = cache_info().hits
+        UserAccount._snapshot_layout()
+        self.assertEqual(cache_info().hits, hits + 1)
@@ -1,8 +1,14 @@
-from django.test import TestCase
 from datetime import datetime, timezone
+from unittest.mock import patch
+
+from django.db.models import Value
+from django.db.models import DEFERRED
+from django.test import TestCase
 
+from django_lifecycle.decorators import HookConfig
 from django_lifecycle.model_state import ModelState
-from tests.testapp.models import UserAccount, Organization
+from django_lifecycle.model_state import Snapshot
+from tests.testapp.models import Article, UserAccount, Organization
 
 
 class ModelStateTests(TestCase):
@@ -63,3 +69,78 @@ class ModelStateTests(TestCase):
                 "status": ("active", "inactive"),
             },
         )
+
+
+class SnapshotTests(TestCase):
+    def setUp(self):
+        Organization.objects.create(name="The Simpsons")
+        Organization.objects.create(name="Flanders")
+
+    def test_loaded_values_are_stored_in_a_tuple(self):
+        simpsons, flanders = Organization.objects.order_by("pk")
+        state = simpsons._initial_state.initial_state
+
+        self.assertIsInstance(state, Snapshot)
+        self.assertEqual(state.values, (simpsons.pk, "The Simpsons"))
+        self.assertIsNone(state.extra)
+        self.assertIs(state.layout, flanders._initial_state.initial_state.layout)
+        self.assertFalse(hasattr(simpsons._initial_state, "__dict__"))
+
+    def test_deferred_fields_are_left_out(self):
+        org = Organization.objects.only("pk").first()
+        state = org._initial_state.initial_state
+
+        self.assertEqual(state.values, (org.pk, DEFERRED))
+        self.assertNotIn("name", state)
+        self.assertEqual(dict(state), {"id": org.pk})
+
+    def test_other_attributes_are_snapshotted(self):
+        org = Organization.objects.annotate(rank=Value(1)).first()
+        state = ModelState.from_instance(org).initial_state
+
+        self.assertEqual(state.extra, {"rank": 1})
+        self.assertEqual(state["name"], org.name)
+
+    def test_values_recorded_later_take_precedence(self):
+        state = Snapshot(Organization._snapshot_layout(), (1, "The Simpsons"))
+        state["name"] = "Flanders"
+
+        self.assertEqual(state["name"], "Flanders")
+        self.assertEqual(dict(state), {"id": 1, "name": "Flanders"})
+        del state["name"]
+        self.assertNotIn("name", state)
+
+
+class WatchedFieldsOnlyModelStateTests(TestCase):
+    def test_snapshot_only_contains_watched_fields(self):
+        Article.objects.create(title="Springfield", body="A long story")
+        article = Article.objects.get()
+
+        self.assertEqual(article._snapshot_state(), {"status": "draft"})
+
+    def test_unwatched_field_is_captured_on_first_access(self):
+        Article.objects.create(title="Springfield", body="A long story")
+        article = Article.objects.get()
+
+        self.assertFalse(article.has_changed("title"))
+        article.title = "Shelbyville"
+        self.assertTrue(article.has_changed("title"))
+        self.assertEqual(article.initial_value("title"), "Springfield")
+
+    def test_hooks_still_fire_on_watched_fields(self):
+        article = Article.objects.create(title="Springfield")
+        article.status = "published"
+        article.save()
+
+        self.assertIsNotNone(article.published_at)
+
+    def test_condition_without_known_fields_snapshots_everything(self):
+        with patch.object(Article, "_hook_dispatch_table") as dispatch_table:
+            dispatch_table.return_value = {
+                "before_save": [(HookConfig("before_save", condition=bool), None)]
+            }
+            Article._snapshot_field_names.cache_clear()
+            try:
+                self.assertIsNone(Article._snapshot_field_names())
+            finally:
+                Article._snapshot_field_names.cache_clear()
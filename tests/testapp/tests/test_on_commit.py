@@ -0,0 +1,221 @@
+import gc
+
+from django.core import mail
+from django.db import transaction
+from django.test import TestCase
+from django.test import TransactionTestCase
+
+from django_lifecycle import AFTER_SAVE
+from django_lifecycle import hook
+from django_lifecycle.decorators import DjangoLifeCycleException
+from django_lifecycle.on_commit import InitialStateReset
+from tests.testapp.models import Organization
+from tests.testapp.models import Page
+from tests.testapp.models import UserAccount
+
+
+class InitialStateResetTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.orgs = [Organization.objects.create(name=f"Org {i}") for i in range(3)]
+
+    def test_saves_in_a_transaction_share_one_callback(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                for org in self.orgs:
+                    org.name += " (renamed)"
+                    org.save()
+                    org.save()
+
+        self.assertEqual(len(callbacks), 1)
+        for org in self.orgs:
+            self.assertFalse(org.has_changed("name"))
+
+    def test_instances_are_weakly_referenced(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                orgs = [Organization.objects.create(name=f"New {i}") for i in range(3)]
+                orgs[0].save()
+                reset = transaction.get_connection().run_on_commit[-1][1]
+                self.assertEqual(len(reset.instances), 3)
+
+                orgs = None
+                gc.collect()
+
+        self.assertIs(callbacks[0], reset)
+        self.assertIsInstance(reset, InitialStateReset)
+        self.assertEqual(len(reset.instances), 0)
+
+    def test_resets_registered_in_rolled_back_savepoint_are_dropped(self):
+        first, second, _ = self.orgs
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        first.name = "Rolled back"
+                        first.save()
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+
+                second.name = "Committed"
+                second.save()
+
+        self.assertTrue(first.has_changed("name"))
+        self.assertFalse(second.has_changed("name"))
+
+    def test_reset_pending_before_a_savepoint_is_shared_in_it(self):
+        first, second, _ = self.orgs
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                first.name = "Committed"
+                first.save()
+
+                try:
+                    with transaction.atomic():
+                        second.name = "Rolled back"
+                        second.save()
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+
+        # Like the changes kept in memory
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(second.has_changed("name"))
+
+    def test_resets_run_after_on_commit_hooks(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            accounts = [
+                UserAccount.objects.create(
+                    username=f"user{i}", email=f"old{i}@example.com"
+                )
+                for i in range(2)
+            ]
+        mail.outbox = []
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                for i, account in enumerate(accounts):
+                    account.email = f"new{i}@example.com"
+                    account.save()
+
+        # The hooks registered in between don't split the reset
+        resets = [c for c in callbacks if isinstance(c, InitialStateReset)]
+        self.assertEqual(len(resets), 1)
+
+        self.assertEqual(
+            [message.body for message in mail.outbox],
+            [
+                UserAccount.build_email_changed_body(
+                    old_email=f"old{i}@example.com", new_email=f"new{i}@example.com"
+                )
+                for i in range(2)
+            ],
+        )
+        for account in accounts:
+            self.assertFalse(account.has_changed("email"))
+
+
+class DedupedOnCommitHookTests(TestCase):
+    def sent(self, subject):
+        return [message.body for message in mail.outbox if message.subject == subject]
+
+    def test_hook_runs_once_per_row_with_final_state(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                page = Page.objects.create(title="Draft")
+                for title in ("Review", "Published"):
+                    page.title = title
+                    page.save()
+
+                # Another instance of the same row replaces the first one
+                other = Page.objects.get(pk=page.pk)
+                other.title = "Archived"
+                other.save()
+
+        # One per hook, plus the initial state reset
+        self.assertEqual(len(callbacks), 3)
+        self.assertEqual(self.sent("Purge"), ["Archived"])
+
+    def test_hook_runs_once_for_saves_made_directly_in_the_test(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            page = Page.objects.create(title="Draft")
+            page.title = "Published"
+            page.save()
+            page.save()
+
+        self.assertEqual(self.sent("Purge"), ["Published"])
+        self.assertEqual(self.sent("Reindex"), ["Published"])
+
+    def test_batch_hook_runs_once_with_all_rows(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                pages = [Page.objects.create(title=f"Page {i}") for i in range(3)]
+                pages[0].save()
+
+        self.assertEqual(self.sent("Reindex"), ["Page 0, Page 1, Page 2"])
+        self.assertEqual(self.sent("Purge"), ["Page 0", "Page 1", "Page 2"])
+
+    def test_hook_runs_once_when_dispatch_table_is_rebuilt(self):
+        self.addCleanup(Page._hook_dispatch_table.cache_clear)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                page = Page.objects.create(title="Draft")
+                Page._hook_dispatch_table.cache_clear()
+                page.title = "Published"
+                page.save()
+
+        self.assertEqual(self.sent("Purge"), ["Published"])
+
+    def test_hooks_run_again_in_the_next_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            page = Page.objects.create(title="Draft")
+        mail.outbox = []
+
+        for title in ("Review", "Published"):
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    page.title = title
+                    page.save()
+
+        self.assertEqual(self.sent("Purge"), ["Review", "Published"])
+
+    def test_hooks_pending_from_rolled_back_transaction_are_dropped(self):
+        try:
+            with transaction.atomic():
+                Page.objects.create(title="Rolled back")
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                Page.objects.create(title="Committed")
+
+        self.assertEqual(self.sent("Purge"), ["Committed"])
+
+    def test_dedupe_requires_on_commit(self):
+        with self.assertRaises(DjangoLifeCycleException):
+            hook(AFTER_SAVE, dedupe=True)
+
+
+class CommittedTransactionTests(TransactionTestCase):
+    def test_on_commit_hooks_and_resets_are_merged(self):
+        with transaction.atomic():
+            pages = [Page.objects.create(title=f"Page {i}") for i in range(2)]
+            for page in pages:
+                page.title += " (edited)"
+                page.save()
+
+            callbacks = transaction.get_connection().run_on_commit
+            self.assertEqual(len(callbacks), 3)
+
+        self.assertEqual(
+            [message.body for message in mail.outbox],
+            ["Page 0 (edited)", "Page 1 (edited)", "Page 0 (edited), Page 1 (edited)"],
+        )
+        for page in pages:
+            self.assertFalse(page.has_changed("title"))
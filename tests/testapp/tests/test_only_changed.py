@@ -0,0 +1,130 @@
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.db import transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tests.testapp.models import Article
+from tests.testapp.models import Organization
+from tests.testapp.models import Ticket
+from tests.testapp.models import UserAccount
+from tests.testapp.tests import CommittedCreateMixin
+
+
+class SaveOnlyChangedTests(CommittedCreateMixin, TestCase):
+    def updates(self, queries):
+        return [query["sql"] for query in queries if query["sql"].startswith("UPDATE")]
+
+    def test_only_changed_fields_are_written(self):
+        org = self.create(Organization, name="Springfield Elementary")
+        org.name = "Springfield Elementary School"
+
+        with CaptureQueriesContext(connection) as queries:
+            org.save(only_changed=True)
+
+        [update] = self.updates(queries)
+        self.assertIn('"name"', update)
+        self.assertEqual(Organization.objects.get().name, org.name)
+
+    def test_fields_changed_by_before_hooks_are_written(self):
+        account = self.create(UserAccount, username="homer", first_name="Homer")
+        account.first_name = "Max"
+
+        with CaptureQueriesContext(connection) as queries:
+            account.save(only_changed=True)
+
+        [update] = self.updates(queries)
+        self.assertIn('"first_name"', update)
+        self.assertIn('"name_changes"', update)
+        self.assertNotIn('"username"', update)
+        self.assertEqual(UserAccount.objects.get().name_changes, 1)
+
+    def test_nothing_is_written_if_nothing_changed(self):
+        account = self.create(UserAccount, username="homer")
+
+        with CaptureQueriesContext(connection) as queries:
+            account.save(only_changed=True)
+
+        self.assertEqual(self.updates(queries), [])
+
+    def test_auto_now_fields_are_written_with_changes(self):
+        ticket = self.create(Ticket, title="Printer on fire")
+        updated_at = ticket.updated_at
+        ticket.resolution = "Extinguished"
+        ticket.save(only_changed=True)
+
+        self.assertGreater(Ticket.objects.get().updated_at, updated_at)
+
+    def test_reverted_changes_are_written(self):
+        org = self.create(Organization, name="Springfield Elementary")
+
+        with transaction.atomic():
+            org.name = "Springfield Elementary School"
+            org.save(only_changed=True)
+            org.name = "Springfield Elementary"
+            org.save(only_changed=True)
+
+        self.assertEqual(Organization.objects.get().name, "Springfield Elementary")
+
+    def test_written_changes_are_not_written_again(self):
+        org = self.create(Organization, name="Springfield Elementary")
+
+        with transaction.atomic():
+            org.name = "Springfield Elementary School"
+            org.save(only_changed=True)
+
+            with CaptureQueriesContext(connection) as queries:
+                org.save(only_changed=True)
+
+        self.assertEqual(self.updates(queries), [])
+
+    def test_given_update_fields_are_kept(self):
+        org = self.create(Organization, name="Springfield Elementary")
+        org.name = "Springfield Elementary School"
+        org.save(only_changed=True, update_fields=[])
+
+        self.assertEqual(Organization.objects.get().name, "Springfield Elementary")
+
+    def test_model_option(self):
+        account = self.create(UserAccount, username="homer")
+
+        with patch.object(UserAccount, "lifecycle_save_only_changed", True):
+            with CaptureQueriesContext(connection) as queries:
+                account.save()
+                account.email = "homer@example.com"
+                account.save()
+
+        [update] = self.updates(queries)
+        self.assertIn('"email"', update)
+        self.assertNotIn('"username"', update)
+
+    def test_asave(self):
+        ticket = self.create(Ticket, title="Printer on fire")
+        ticket.resolution = "Extinguished"
+
+        with CaptureQueriesContext(connection) as queries:
+            async_to_sync(ticket.asave)(only_changed=True)
+
+        [update] = self.updates(queries)
+        self.assertIn('"resolution"', update)
+        self.assertNotIn('"title"', update)
+
+    def test_asave_reverted_changes_are_written(self):
+        ticket = self.create(Ticket, title="Printer on fire")
+
+        with transaction.atomic():
+            ticket.resolution = "Extinguished"
+            async_to_sync(ticket.asave)(only_changed=True)
+            ticket.resolution = ""
+            async_to_sync(ticket.asave)(only_changed=True)
+
+        self.assertEqual(Ticket.objects.get().resolution, "")
+
+    def test_full_save_if_changes_cannot_be_told(self):
+        article = self.create(Article, title="Springfield")
+        article.body = "A long story"
+        article.save(only_changed=True)
+
+        self.assertEqual(Article.objects.get().body, "A long story")
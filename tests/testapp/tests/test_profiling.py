@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from django_lifecycle.profiling import hook_profiler
+from tests.testapp.models import Product
+from tests.testapp.models import Ticket
+from tests.testapp.models import UserAccount
+
+
+class HookProfilerTests(TestCase):
+    def setUp(self):
+        hook_profiler.reset()
+        hook_profiler.enable()
+        self.addCleanup(hook_profiler.disable)
+        self.addCleanup(hook_profiler.reset)
+
+    def test_records_save_phases(self):
+        UserAccount.objects.create(username="homer", email="HOMER@example.com")
+
+        stats = hook_profiler.snapshot()
+        before_save = stats[("testapp.UserAccount", "before_save")]
+        self.assertEqual(before_save.calls, 1)
+        self.assertEqual(before_save.considered, 1)
+        self.assertEqual(before_save.fired, 1)
+        self.assertEqual(list(before_save.methods), ["lowercase_email"])
+        self.assertGreater(before_save.condition_time, 0)
+        self.assertGreater(before_save.methods["lowercase_email"].run_time, 0)
+
+        before_update = stats[("testapp.UserAccount", "before_create")]
+        self.assertEqual(before_update.fired, 1)
+
+    def test_records_considered_but_not_fired_hooks(self):
+        account = UserAccount.objects.create(username="homer")
+        hook_profiler.reset()
+
+        account.save()
+
+        before_update = hook_profiler.snapshot()[
+            ("testapp.UserAccount", "before_update")
+        ]
+        self.assertEqual(before_update.calls, 1)
+        self.assertEqual(before_update.considered, 4)
+        self.assertEqual(before_update.fired, 0)
+
+    def test_records_batches(self):
+        Product.objects.bulk_create(
+            [Product(name="Duff", sku="d"), Product(name="Buzz", sku="b")]
+        )
+
+        stats = hook_profiler.snapshot()
+        before_create = stats[("testapp.Product", "before_create")]
+        self.assertEqual(before_create.calls, 2)
+        self.assertEqual(before_create.methods["normalize_sku"].calls, 2)
+        after_create = stats[("testapp.Product", "after_create")]
+        self.assertEqual(after_create.methods["announce_new_products"].calls, 2)
+
+    def test_snapshot_is_a_copy_and_reset_clears_it(self):
+        UserAccount.objects.create(username="homer")
+        snapshot = hook_profiler.snapshot()
+        UserAccount.objects.create(username="marge")
+
+        self.assertEqual(snapshot[("testapp.UserAccount", "before_create")].calls, 1)
+        hook_profiler.reset()
+        self.assertEqual(hook_profiler.snapshot(), {})
+
+    def test_disabled_profiler_records_nothing(self):
+        hook_profiler.disable()
+        UserAccount.objects.create(username="homer")
+        self.assertEqual(hook_profiler.snapshot(), {})
+
+    def test_disabled_profiler_doesnt_time_async_hooks(self):
+        hook_profiler.disable()
+        ticket = Ticket(title="Printer on fire")
+
+        with patch("django_lifecycle.mixins.perf_counter") as perf_counter:
+            async_to_sync(ticket.asave)()
+
+        perf_counter.assert_not_called()
+        self.assertIn("notify_author done", ticket.events)
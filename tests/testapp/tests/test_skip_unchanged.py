@@ -0,0 +1,108 @@
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.db import transaction
+from django.test import TestCase
+
+from django_lifecycle import AFTER_CREATE
+from django_lifecycle import hook
+from django_lifecycle.decorators import DjangoLifeCycleException
+from django_lifecycle.profiling import skipped_saves
+from tests.testapp.models import Article
+from tests.testapp.models import Organization
+from tests.testapp.models import Ticket
+from tests.testapp.models import UserAccount
+from tests.testapp.tests import CommittedCreateMixin
+
+
+class SkipUnchangedSavesTests(CommittedCreateMixin, TestCase):
+    def setUp(self):
+        skipped_saves.reset()
+        self.addCleanup(skipped_saves.reset)
+
+    def test_unchanged_save_is_skipped(self):
+        account = self.create(UserAccount, username="homer", first_name="Homer")
+
+        with self.assertNumQueries(0):
+            account.save(skip_unchanged=True)
+
+        self.assertEqual(skipped_saves.snapshot(), {"testapp.UserAccount": 1})
+
+    def test_changed_save_is_not_skipped(self):
+        account = self.create(UserAccount, username="homer", first_name="Homer")
+        account.first_name = "Max"
+        account.save(skip_unchanged=True)
+
+        self.assertEqual(UserAccount.objects.get().name_changes, 1)
+        self.assertEqual(skipped_saves.snapshot(), {})
+
+    def test_reverted_save_is_not_skipped(self):
+        org = self.create(Organization, name="Springfield Elementary")
+
+        with transaction.atomic():
+            org.name = "Springfield Elementary School"
+            org.save(skip_unchanged=True)
+            org.name = "Springfield Elementary"
+            org.save(skip_unchanged=True)
+
+        self.assertEqual(Organization.objects.get().name, "Springfield Elementary")
+        self.assertEqual(skipped_saves.snapshot(), {})
+
+    def test_only_hooks_on_unchanged_fire(self):
+        ticket = self.create(Ticket, title="  Printer on fire  ")
+        ticket.events.clear()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            ticket.save(skip_unchanged=True)
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(ticket.events, ["updated"])
+
+    def test_bypassed_hooks_dont_fire(self):
+        ticket = self.create(Ticket, title="Printer on fire")
+        ticket.events.clear()
+
+        ticket.save(skip_unchanged=True, skip_hooks=True)
+
+        self.assertEqual(ticket.events, [])
+        self.assertEqual(skipped_saves.snapshot(), {"testapp.Ticket": 1})
+
+    def test_model_option(self):
+        org = self.create(Organization, name="Springfield Elementary")
+
+        with patch.object(Organization, "lifecycle_skip_unchanged_saves", True):
+            with self.assertNumQueries(0):
+                org.save()
+
+            org.save(skip_unchanged=False)
+
+        self.assertEqual(skipped_saves.snapshot(), {"testapp.Organization": 1})
+
+    def test_inserts_and_given_update_fields_are_not_skipped(self):
+        org = Organization(name="Springfield Elementary")
+        org.save(skip_unchanged=True)
+        org.save(skip_unchanged=True, update_fields=["name"])
+
+        self.assertEqual(skipped_saves.snapshot(), {})
+
+    def test_watched_fields_only_models_are_not_skipped(self):
+        article = self.create(Article, title="Springfield")
+        article.body = "A long story"
+        article.save(skip_unchanged=True)
+
+        self.assertEqual(Article.objects.get().body, "A long story")
+        self.assertEqual(skipped_saves.snapshot(), {})
+
+    def test_asave(self):
+        ticket = self.create(Ticket, title="Printer on fire")
+        ticket.events.clear()
+
+        with self.assertNumQueries(0):
+            async_to_sync(ticket.asave)(skip_unchanged=True)
+
+        self.assertEqual(ticket.events, ["updated"])
+        self.assertEqual(skipped_saves.snapshot(), {"testapp.Ticket": 1})
+
+    def test_on_unchanged_requires_after_save_hooks(self):
+        with self.assertRaises(DjangoLifeCycleException):
+            hook(AFTER_CREATE, on_unchanged=True)
@@ -92,8 +92,9 @@ class UserAccountTestCase(TestCase):
         self.assertEqual(account.email, "homer.simpson@springfieldnuclear.com")
 
     def test_notify_org_name_change(self):
-        org = Organization.objects.create(name="Hogwarts")
-        UserAccount.objects.create(**self.stub_data, organization=org)
+        with self.captureOnCommitCallbacks(execute=True):
+            org = Organization.objects.create(name="Hogwarts")
+            UserAccount.objects.create(**self.stub_data, organization=org)
         mail.outbox = []
 
         account = UserAccount.objects.get()
@@ -104,7 +105,8 @@ class UserAccountTestCase(TestCase):
 
             account.save()
 
-        self.assertEqual(len(callbacks), 3)
+        # The hook, and the initial state reset shared by both saves
+        self.assertEqual(len(callbacks), 2)
         self.assertEqual(len(mail.outbox), 1)
         self.assertEqual(
             mail.outbox[0].subject, "The name of your organization has changed!"
@@ -119,8 +121,9 @@ class UserAccountTestCase(TestCase):
         self.assertEqual(len(mail.outbox), 0)
 
     def test_additional_notify_sent_for_specific_org_name_change(self):
-        org = Organization.objects.create(name="Hogwarts")
-        UserAccount.objects.create(**self.stub_data, organization=org)
+        with self.captureOnCommitCallbacks(execute=True):
+            org = Organization.objects.create(name="Hogwarts")
+            UserAccount.objects.create(**self.stub_data, organization=org)
 
         mail.outbox = []
 
@@ -132,8 +135,8 @@ class UserAccountTestCase(TestCase):
 
         self.assertEqual(
             len(callbacks),
-            3,
-            msg="One hook and the _reset_initial_state (2) should be in the on_commit callbacks",
+            2,
+            msg="One hook and the shared _reset_initial_state should be in the on_commit callbacks",
         )
         self.assertEqual(len(mail.outbox), 2)
         self.assertEqual(
@@ -0,0 +1,45 @@
+from django.test import TestCase
+
+from django_lifecycle.utils import get_field_name_map
+from django_lifecycle.utils import get_value
+from django_lifecycle.utils import sanitize_field_name
+from tests.testapp.models import ModelWithGenericForeignKey
+from tests.testapp.models import Organization
+from tests.testapp.models import UserAccount
+
+
+class SanitizeFieldNameTests(TestCase):
+    def test_field_name_map_is_built_once_per_model(self):
+        self.assertIs(get_field_name_map(UserAccount), get_field_name_map(UserAccount))
+
+    def test_fk_name_and_attname_resolve_to_attname(self):
+        account = UserAccount()
+        self.assertEqual(
+            sanitize_field_name(account, "organization"), "organization_id"
+        )
+        self.assertEqual(
+            sanitize_field_name(account, "organization_id"), "organization_id"
+        )
+
+    def test_regular_and_unknown_names_are_left_untouched(self):
+        account = UserAccount()
+        self.assertEqual(sanitize_field_name(account, "username"), "username")
+        self.assertEqual(
+            sanitize_field_name(account, "organization.name"), "organization.name"
+        )
+        self.assertEqual(sanitize_field_name(account, "full_name"), "full_name")
+
+    def test_field_without_internal_type_resolves_to_its_name(self):
+        instance = ModelWithGenericForeignKey()
+        self.assertEqual(
+            sanitize_field_name(instance, "content_object"), "content_object"
+        )
+
+
+class GetValueTests(TestCase):
+    def test_dotted_path(self):
+        account = UserAccount(organization=Organization(name="Dunder Mifflin"))
+        self.assertEqual(get_value(account, "organization.name"), "Dunder Mifflin")
+
+    def test_dotted_path_through_missing_relation(self):
+        self.assertIsNone(get_value(UserAccount(), "organization.name"))